@@ -0,0 +1,138 @@
+import argparse
+import os
+import re
+import sys
+import time
+from collections import Counter, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+from catalog_loader import load_catalog
+from custom_import import format_report, import_into
+from habitable_zone import HZ_MODELS, SIMPLE_MODEL
+from render_cache import CachedRenderer, RenderCache, atomic_write
+
+FORMATS = ("png", "svg")
+
+# path is None and error a message when the system could not be exported
+ExportResult = namedtuple("ExportResult", ["name", "path", "seconds", "error"])
+
+# Per-process state set up once by _init_worker and reused for every system
+_worker = {}
+
+
+def output_filename(name, format):
+    return re.sub(r"[^A-Za-z0-9._-]+", "_", name).strip("_") + "." + format
+
+
+def output_filenames(names, indices, format):
+    # One distinct file per system.  Names that map to the same file ("A B"
+    # and "A_B", or ones differing only in case, for case-insensitive file
+    # systems) get their catalog index appended.
+    files = [output_filename(name, format) for name in names]
+    counts = Counter(file.casefold() for file in files)
+    taken = {file.casefold() for file in files if counts[file.casefold()] == 1}
+    for i, (name, index) in enumerate(zip(names, indices)):
+        if counts[files[i].casefold()] == 1:
+            continue
+        suffix = f"_{index}"
+        while output_filename(name + suffix, format).casefold() in taken:
+            suffix += f"_{index}"
+        files[i] = output_filename(name + suffix, format)
+        taken.add(files[i].casefold())
+    return files
+
+
+def select_systems(catalog, pattern=None):
+    if pattern is None:
+        return list(range(len(catalog)))
+    regex = re.compile(pattern, re.IGNORECASE)
+    return [i for i, name in enumerate(catalog.names) if regex.search(name)]
+
+
+def load_export_catalog(catalog_path=None, custom_paths=()):
+    # The catalog to export, with imported custom systems appended after it,
+    # and the import reports
+    catalog = load_catalog(catalog_path)
+    if not custom_paths:
+        return catalog, []
+    return import_into(catalog, custom_paths)
+
+
+def _init_worker(catalog_path, custom_paths, cache_dir, figsize, dpi, hz_model):
+    _worker["catalog"], _ = load_export_catalog(catalog_path, custom_paths)
+    # Memory tier disabled: each system is rendered once per run, so only the
+    # optional shared disk tier can produce hits.
+    _worker["renderer"] = CachedRenderer(RenderCache(max_bytes=0, directory=cache_dir), figsize, dpi,
+                                          hz_model)
+
+
+def _export_system(index, output_dir, filename, format):
+    # Errors are returned rather than raised, so one bad system does not end
+    # the pool.map iteration and abort the rest of the export
+    start = time.perf_counter()
+    catalog = _worker["catalog"]
+    name = catalog.names[index]
+    try:
+        system = catalog.system(index)
+        data = _worker["renderer"].render(system["luminosity"], system["exoplanets"], system["planet_labels"],
+                                          format, system["temperature"])
+        path = os.path.join(output_dir, filename)
+        atomic_write(path, data)
+    except Exception as exception:
+        return ExportResult(name, None, time.perf_counter() - start, f"{type(exception).__name__}: {exception}")
+    return ExportResult(name, path, time.perf_counter() - start, None)
+
+
+def export_systems(output_dir, indices, filenames, format="png", workers=None, cache_dir=None, figsize=(8, 8),
+                   dpi=100, catalog_path=None, hz_model=SIMPLE_MODEL, custom_paths=()):
+    # Yields an ExportResult per system, in the order of `indices`: pool.map
+    # returns results in input order even though chunks finish out of order.
+    # `filenames` are the output files, one per index (see output_filenames).
+    workers = workers or os.cpu_count() or 1
+    chunksize = max(1, len(indices) // (workers * 4))
+    initargs = (catalog_path, tuple(custom_paths), cache_dir, figsize, dpi, hz_model)
+    with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=initargs) as pool:
+        yield from pool.map(_export_system, indices, [output_dir] * len(indices), filenames,
+                            [format] * len(indices), chunksize=chunksize)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render every planetary system plot headlessly.")
+    parser.add_argument("output_dir")
+    parser.add_argument("--catalog", help="archive CSV export to load instead of the bundled systems")
+    parser.add_argument("--custom", action="append", default=[], metavar="FILE",
+                        help="CSV or JSON Lines file of custom systems to export as well (repeatable)")
+    parser.add_argument("--format", choices=FORMATS, default="png")
+    parser.add_argument("--match", help="only export systems whose name matches this regular expression")
+    parser.add_argument("--workers", type=int, help="worker processes (default: CPU count)")
+    parser.add_argument("--cache-dir", help="on-disk render cache shared by the workers")
+    parser.add_argument("--dpi", type=int, default=100)
+    parser.add_argument("--hz-model", choices=HZ_MODELS, default=SIMPLE_MODEL)
+    args = parser.parse_args(argv)
+
+    catalog, reports = load_export_catalog(args.catalog, args.custom)
+    for path, report in zip(args.custom, reports):
+        print(format_report(report, path))
+    indices = select_systems(catalog, args.match)
+    filenames = output_filenames([catalog.names[i] for i in indices], indices, args.format)
+    start = time.perf_counter()
+    failed = 0
+    for result in export_systems(args.output_dir, indices, filenames, args.format, args.workers, args.cache_dir,
+                                 dpi=args.dpi, catalog_path=args.catalog, hz_model=args.hz_model,
+                                 custom_paths=args.custom):
+        if result.error is None:
+            print(f"{result.seconds * 1000:8.1f} ms  {result.path}  ({result.name})")
+        else:
+            failed += 1
+            print(f"{result.seconds * 1000:8.1f} ms  FAILED  ({result.name}): {result.error}")
+    print(f"Exported {len(indices) - failed} systems in {time.perf_counter() - start:.2f} s"
+          + (f", {failed} failed" if failed else ""))
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
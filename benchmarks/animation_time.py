@@ -0,0 +1,51 @@
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import numpy as np
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+from orbits import orbital_positions
+from plotting import ANIMATION_FPS, ANIMATION_FRAMES, SystemPlot
+
+PLANETS = 10_000
+TIMED_FRAMES = 120
+
+
+def main():
+    rng = np.random.default_rng(0)
+    semi_major_axis = rng.uniform(0.05, 2.9, PLANETS)
+    eccentricity = rng.uniform(0, 0.5, PLANETS)
+    period = 365.25 * semi_major_axis ** 1.5
+
+    start = time.perf_counter()
+    positions = orbital_positions(semi_major_axis, eccentricity, period,
+                                  np.linspace(0, period.max(), ANIMATION_FRAMES, endpoint=False))
+    print(f"propagate {ANIMATION_FRAMES} x {PLANETS} orbits: {(time.perf_counter() - start) * 1000:.0f} ms "
+          f"({positions.nbytes / 2 ** 20:.0f} MiB table)")
+
+    plot = SystemPlot(Figure(figsize=(8, 8)), blit=True)
+    FigureCanvasAgg(plot.figure)
+    plot.update(1.0, semi_major_axis, [str(i) for i in range(PLANETS)], temperature=5772)
+    plot.animate(positions)
+    plot.figure.canvas.draw()
+
+    start = time.perf_counter()
+    for frame in range(TIMED_FRAMES):
+        plot.show_frame(frame)
+    frame_ms = (time.perf_counter() - start) * 1000 / TIMED_FRAMES
+    budget_ms = 1000 / ANIMATION_FPS
+    print(f"{'ok' if frame_ms <= budget_ms else 'SLOW'}: {frame_ms:.1f} ms per frame "
+          f"(budget {budget_ms:.1f} ms at {ANIMATION_FPS} fps)")
+    return 0 if frame_ms <= budget_ms else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,44 @@
+import os
+import subprocess
+import sys
+
+# Budget for `import maincode` in a fresh interpreter, excluding interpreter
+# startup itself.  Batch workers pay this on every spawn.
+IMPORT_BUDGET_MS = 20.0
+HEAVY_MODULES = ("numpy", "matplotlib", "tkinter", "systems_data")
+REPEATS = 5
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_PROBE = (
+    "import sys, time\n"
+    "start = time.perf_counter()\n"
+    "import maincode\n"
+    "elapsed = (time.perf_counter() - start) * 1000\n"
+    "loaded = [m for m in {heavy!r} if m in sys.modules]\n"
+    "print(elapsed, ','.join(loaded))\n"
+)
+
+
+def measure_import_ms():
+    probe = _PROBE.format(heavy=HEAVY_MODULES)
+    output = subprocess.run([sys.executable, "-c", probe], cwd=ROOT, check=True,
+                            capture_output=True, text=True).stdout.split()
+    return float(output[0]), output[1].split(",") if len(output) > 1 else []
+
+
+def main():
+    timings = []
+    for _ in range(REPEATS):
+        elapsed, loaded = measure_import_ms()
+        if loaded:
+            print(f"FAIL: importing maincode loaded {', '.join(loaded)}")
+            return 1
+        timings.append(elapsed)
+    best = min(timings)
+    status = "ok" if best <= IMPORT_BUDGET_MS else "FAIL"
+    print(f"{status}: import maincode took {best:.2f} ms (budget {IMPORT_BUDGET_MS:.0f} ms, best of {REPEATS})")
+    return 0 if status == "ok" else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,48 @@
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import numpy as np
+
+from render_worker import BackgroundRenderer
+
+SIZE = 10_000
+# Selections arriving faster than a render finishes, as when scrolling the selector
+BURST = 20
+
+
+def make_system(size, seed):
+    rng = np.random.default_rng(seed)
+    return 1.0, np.sort(rng.uniform(0.05, 2.9, size)), [f"P{i + 1}" for i in range(size)]
+
+
+def main():
+    renderer = BackgroundRenderer()
+    renderer.submit(*make_system(10, 0))
+    renderer.wait()  # figure creation is not part of the measurement
+
+    systems = [make_system(SIZE, seed) for seed in range(BURST)]
+    blocked = []
+    for system in systems:
+        start = time.perf_counter()
+        renderer.submit(*system)
+        blocked.append((time.perf_counter() - start) * 1000)
+    result = renderer.wait()
+    stats = renderer.stats
+    renderer.close()
+
+    print(f"{BURST} selections of {SIZE} planets")
+    print(f"caller blocked per submit: {max(blocked):.2f} ms max")
+    print(f"newest render latency: {result.latency * 1000:.1f} ms")
+    print(f"rendered {stats.completed - 1}, dropped {stats.dropped} stale requests")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
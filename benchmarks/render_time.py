@@ -0,0 +1,86 @@
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import numpy as np
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.patches import Circle
+
+from habitable_zone import hz_bounds
+from plotting import SystemPlot
+
+SIZES = (10, 1_000, 100_000)
+# The per-planet ax.plot/ax.text path is only timed where it finishes in reasonable time
+LEGACY_MAX_SIZE = 1_000
+REPEATS = 3
+
+
+def make_system(size, seed=0):
+    rng = np.random.default_rng(seed)
+    exoplanets = np.sort(rng.uniform(0.05, 2.9, size))
+    planet_labels = [f"{i + 1}. P{i + 1}" for i in range(size)]
+    return 1.0, exoplanets, planet_labels
+
+
+def make_collection_draw():
+    # One reused SystemPlot, as in the GUI.  update() ends in draw_idle(),
+    # which the Agg canvas performs synchronously, so this times a full render.
+    plot = SystemPlot(Figure(figsize=(8, 8)))
+    FigureCanvasAgg(plot.figure)
+    return plot.update
+
+
+def draw_legacy(luminosity, exoplanets, planet_labels):
+    # The pre-collection approach: the same figure, but two artists per planet
+    figure = Figure(figsize=(8, 8))
+    FigureCanvasAgg(figure)
+    ax = figure.add_subplot()
+    ax.set_xlim(-3, 3)
+    ax.set_ylim(-3, 3)
+    d_inner, d_outer = hz_bounds(luminosity)
+    ax.add_patch(Circle((0, 0), d_outer, color='green', alpha=0.5, label="Outer HZ"))
+    ax.add_patch(Circle((0, 0), d_inner, color='blue', alpha=0.5, label="Inner HZ"))
+    angle_step = 360 / len(exoplanets)
+    for i, (semi_major_axis, label) in enumerate(zip(exoplanets, planet_labels)):
+        angle = np.radians(i * angle_step)
+        x = semi_major_axis * np.cos(angle)
+        y = semi_major_axis * np.sin(angle)
+        ax.plot(x, y, 'ro')
+        ax.text(x + 0.1, y, label, fontsize=8, color='black', ha='center', va='center')
+    ax.add_patch(Circle((0, 0), 0.03, color='yellow', label="Star"))
+    ax.set_xlabel("AU (Astronomical Units)")
+    ax.set_ylabel("AU (Astronomical Units)")
+    ax.set_title("Exoplanets and Habitable Zone")
+    ax.legend()
+    ax.grid()
+    figure.canvas.draw()
+
+
+def best_time_ms(draw, system):
+    timings = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        draw(*system)
+        timings.append((time.perf_counter() - start) * 1000)
+    return min(timings)
+
+
+def main():
+    print(f"{'planets':>8}  {'collection ms':>14}  {'legacy ms':>10}")
+    for size in SIZES:
+        system = make_system(size)
+        collection = best_time_ms(make_collection_draw(), system)
+        legacy = f"{best_time_ms(draw_legacy, system):10.1f}" if size <= LEGACY_MAX_SIZE else f"{'-':>10}"
+        print(f"{size:>8}  {collection:14.1f}  {legacy}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
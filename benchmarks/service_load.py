@@ -0,0 +1,86 @@
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from catalog import load_default_catalog
+from hz_service import HZService
+
+CONNECTIONS = 32
+REQUESTS_PER_CONNECTION = 200
+WORKERS = 2
+# Every connection asks for the same plots in a different order, so cold
+# renders are requested concurrently and have to be coalesced
+PLOTTED_SYSTEMS = 8
+
+
+async def request(reader, writer, path):
+    writer.write(f"GET {path} HTTP/1.1\r\nHost: localhost\r\n\r\n".encode())
+    head = await reader.readuntil(b"\r\n\r\n")
+    lines = head.decode("latin-1").split("\r\n")
+    length = next(int(line.split(":", 1)[1]) for line in lines if line.lower().startswith("content-length:"))
+    await reader.readexactly(length)
+    return int(lines[0].split(" ")[1])
+
+
+async def client(port, paths, latencies, statuses):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    for path in paths:
+        start = time.perf_counter()
+        statuses.append(await request(reader, writer, path))
+        latencies.append(time.perf_counter() - start)
+    writer.close()
+    await writer.wait_closed()
+
+
+def workload(catalog, seed):
+    # Mostly JSON lookups, with one plot request in ten
+    rng = np.random.default_rng(seed)
+    paths = []
+    for i in range(REQUESTS_PER_CONNECTION):
+        system = int(rng.integers(len(catalog)))
+        if i % 10 == 0:
+            paths.append(f"/systems/{system % PLOTTED_SYSTEMS}/plot.png")
+        elif i % 3 == 0:
+            paths.append(f"/hz?luminosity={catalog.luminosity[system]}&model=kopparapu"
+                         f"&temperature={catalog.temperature[system]}")
+        else:
+            paths.append(f"/systems/{system}/classification")
+    return paths
+
+
+async def run():
+    catalog = load_default_catalog()
+    service = HZService(catalog, WORKERS)
+    server = await service.start("127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+
+    latencies, statuses = [], []
+    start = time.perf_counter()
+    await asyncio.gather(*(client(port, workload(catalog, seed), latencies, statuses)
+                           for seed in range(CONNECTIONS)))
+    elapsed = time.perf_counter() - start
+
+    server.close()
+    await server.wait_closed()
+    service.close()
+
+    latencies = np.array(latencies) * 1000
+    print(f"{len(latencies)} requests on {CONNECTIONS} keep-alive connections, {WORKERS} render workers")
+    print(f"throughput: {len(latencies) / elapsed:.0f} requests/s")
+    print(f"latency: p50 {np.percentile(latencies, 50):.2f} ms, p99 {np.percentile(latencies, 99):.2f} ms")
+    print(f"renders {service.stats['renders']}, coalesced {service.stats['coalesced']}, "
+          f"rejected {service.stats['rejected']}, errors {sum(status != 200 for status in statuses)}")
+    return 0
+
+
+def main():
+    return asyncio.run(run())
+
+
+if __name__ == "__main__":
+    sys.exit(main())
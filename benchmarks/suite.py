@@ -0,0 +1,232 @@
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from catalog_loader import CatalogBuilder
+from details import exoplanet_details, planet_rows, system_details
+from habitable_zone import KOPPARAPU_MODEL, SIMPLE_MODEL, effective_flux_table
+from plotting import SystemPlot
+
+# Synthetic catalogs, in planets; sizes above --max-planets are skipped
+SIZES = (10 ** 2, 10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6, 10 ** 7)
+DEFAULT_MAX_PLANETS = 10 ** 6
+PLANETS_PER_SYSTEM = 4
+CHUNK_SIZE = 50_000
+# Small sizes are timed best-of-REPEATS; large ones once, to bound the run time
+REPEATS = 5
+REPEAT_MAX_PLANETS = 10 ** 5
+# Systems rendered and selected per catalog size
+SAMPLED_SYSTEMS = 5
+
+HISTORY = os.path.join(ROOT, "benchmarks", "history.json")
+# A run regresses when a benchmark is slower than its baseline, the median
+# of the last BASELINE_RUNS recorded times for the same size, by more than
+# this factor.  Rendering and the GUI flow are noisier, so they get more
+# headroom.
+BASELINE_RUNS = 5
+DEFAULT_THRESHOLD = 1.5
+THRESHOLDS = {"render_system": 2.0, "select_flow": 2.0}
+# Timings below this are too noisy to compare
+MIN_COMPARABLE_SECONDS = 5e-3
+
+
+def synthetic_chunks(planets, seed=0, chunk_size=CHUNK_SIZE):
+    # Archive-like raw rows: hosts in random order, values as text, so the
+    # builder does the same parsing as for a real export.
+    rng = np.random.default_rng(seed)
+    systems = max(1, planets // PLANETS_PER_SYSTEM)
+    for start in range(0, planets, chunk_size):
+        rows = min(chunk_size, planets - start)
+        host = rng.integers(0, systems, rows)
+        temperature = 3000 + host % 4000
+        yield {
+            "host": np.char.add("Star ", host.astype(str)).tolist(),
+            "planet": np.char.add("P", np.arange(start, start + rows).astype(str)).tolist(),
+            "semi_major_axis": np.round(rng.uniform(0.02, 3.0, rows), 4).astype(str).tolist(),
+            "eccentricity": np.round(rng.uniform(0, 0.6, rows), 3).astype(str).tolist(),
+            "mass": np.round(rng.lognormal(1, 1, rows), 2).astype(str).tolist(),
+            "orbital_period": np.round(rng.lognormal(4, 1.5, rows), 3).astype(str).tolist(),
+            "log_luminosity": np.round(np.log10((temperature / 5772) ** 4), 3).astype(str).tolist(),
+            "radius": np.round(temperature / 5772, 3).astype(str).tolist(),
+            "temperature": temperature.astype(str).tolist(),
+            "distance": np.round(10 + host % 1000, 1).astype(str).tolist(),
+        }
+
+
+def build_catalog(planets):
+    # (catalog, seconds spent in the builder); generating the rows is not timed
+    builder = CatalogBuilder()
+    elapsed = 0.0
+    for chunk in synthetic_chunks(planets):
+        start = time.perf_counter()
+        builder.add_chunk(chunk)
+        elapsed += time.perf_counter() - start
+    start = time.perf_counter()
+    catalog = builder.build()
+    return catalog, elapsed + time.perf_counter() - start
+
+
+def best_of(function, repeats):
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def run_size(planets):
+    repeats = REPEATS if planets <= REPEAT_MAX_PLANETS else 1
+    catalog, build_seconds = build_catalog(planets)
+    results = {"catalog_build": build_seconds}
+
+    def parse():
+        # The parsed columns are cached properties; drop them to time a parse
+        for column in ("mass", "eccentricity", "orbital_period"):
+            catalog.__dict__.pop(column, None)
+        return catalog.mass, catalog.eccentricity, catalog.orbital_period
+
+    results["parse_columns"] = best_of(parse, repeats)
+    results["hz_simple"] = best_of(lambda: catalog.classify(SIMPLE_MODEL), repeats)
+    results["hz_kopparapu"] = best_of(lambda: catalog.classify(KOPPARAPU_MODEL), repeats)
+    table = effective_flux_table()
+    results["hz_kopparapu_table"] = best_of(lambda: catalog.classify(KOPPARAPU_MODEL, table), repeats)
+
+    # Rendering and selection are per system; the sample is spread over the catalog
+    sample = np.linspace(0, len(catalog) - 1, SAMPLED_SYSTEMS).astype(np.int64).tolist()
+    plot = SystemPlot(Figure(figsize=(8, 8)))
+    FigureCanvasAgg(plot.figure)
+
+    def render():
+        for index in sample:
+            planets_of = catalog.planet_slice(index)
+            plot.update(catalog.luminosity[index], catalog.semi_major_axis[planets_of],
+                        catalog.planet_columns["planet_labels"][planets_of], temperature=catalog.temperature[index])
+            plot.figure.canvas.draw()
+
+    results["render_system"] = best_of(render, repeats) / len(sample)
+
+    def select():
+        # What the GUI does on a click, minus Tk: look the system up by name,
+        # fill its details and planet rows, then show its first planet.  A
+        # fresh derived layer per pass includes its first-click computation;
+        # at sizes timed once, so does building the name index.
+        catalog.__dict__.pop("derived", None)
+        for index in sample:
+            index = catalog.index.system_index(catalog.names[index])
+            system_details(catalog, index)
+            planet_rows(catalog, index)(range(min(6, catalog.planet_counts[index])))
+            if catalog.planet_counts[index]:
+                exoplanet_details(catalog, index, 0)
+
+    results["select_flow"] = best_of(select, repeats) / len(sample)
+
+    # Population view: binning the whole catalog, then a zoom to a quarter of it
+    population = catalog.index.population
+    x0, x1, y0, y1 = population.extent
+
+    def rebin():
+        population.density((x0, x1), (y0, y1))
+        population.density((x0, (x0 + x1) / 2), (y0, (y0 + y1) / 2))
+
+    results["population_rebin"] = best_of(rebin, repeats)
+    return results
+
+
+def load_history(path):
+    try:
+        with open(path) as file:
+            return json.load(file)
+    except FileNotFoundError:
+        return []
+
+
+def save_history(path, history):
+    from render_cache import atomic_write
+
+    atomic_write(path, json.dumps(history, indent=1).encode())
+
+
+def find_regressions(run, history):
+    # (benchmark, size, seconds, baseline, threshold) for every result slower
+    # than its baseline by more than its threshold
+    regressions = []
+    for size, results in run["results"].items():
+        for benchmark, seconds in results.items():
+            earlier = [entry["results"][size][benchmark] for entry in history
+                       if benchmark in entry["results"].get(size, {})]
+            if not earlier:
+                continue
+            baseline = float(np.median(earlier[-BASELINE_RUNS:]))
+            threshold = THRESHOLDS.get(benchmark, DEFAULT_THRESHOLD)
+            if seconds > MIN_COMPARABLE_SECONDS and seconds > baseline * threshold:
+                regressions.append((benchmark, size, seconds, baseline, threshold))
+    return regressions
+
+
+def _commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Time catalog build, HZ classification, rendering and the "
+                                                 "selection flow on synthetic catalogs.")
+    parser.add_argument("--max-planets", type=float, default=DEFAULT_MAX_PLANETS,
+                        help=f"largest catalog to run (up to {SIZES[-1]:.0e}; default {DEFAULT_MAX_PLANETS:.0e})")
+    parser.add_argument("--history", default=HISTORY, help="JSON file the results are appended to")
+    parser.add_argument("--check", action="store_true",
+                        help="exit with status 1 if any benchmark regressed against the history")
+    parser.add_argument("--no-save", action="store_true", help="do not append this run to the history")
+    args = parser.parse_args(argv)
+
+    run = {
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "commit": _commit(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "matplotlib": matplotlib.__version__,
+        "results": {},
+    }
+    names = None
+    for planets in (size for size in SIZES if size <= args.max_planets):
+        results = run["results"][str(planets)] = run_size(planets)
+        if names is None:
+            names = list(results)
+            print(f"{'planets':>9}  " + "  ".join(f"{name:>18}" for name in names) + "   (ms)")
+        print(f"{planets:>9}  " + "  ".join(f"{results[name] * 1000:18.2f}" for name in names))
+
+    history = load_history(args.history)
+    regressions = find_regressions(run, history)
+    for benchmark, size, seconds, baseline, threshold in regressions:
+        print(f"REGRESSION: {benchmark} at {size} planets took {seconds * 1000:.2f} ms, "
+              f"baseline {baseline * 1000:.2f} ms (threshold {threshold:.2f}x)")
+    if not args.no_save:
+        save_history(args.history, history + [run])
+    if args.check and regressions:
+        return 1
+    if args.check:
+        print(f"ok: no regressions against {len(history)} earlier runs")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
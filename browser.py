@@ -0,0 +1,146 @@
+from tkinter import ttk
+
+import numpy as np
+
+from details import planet_rows, system_rows
+
+
+class VirtualTable(ttk.Frame):
+    # A Treeview that only ever holds `height` rows.  Scrolling moves a window
+    # over the source and refills those rows through `row_values(indices)`, so
+    # the widget cost does not depend on how many rows the source has.
+    # Sorting uses precomputed orders supplied per column.
+
+    def __init__(self, master, columns, headings, height=10, widths=None, on_select=None):
+        super().__init__(master)
+        self.height = height
+        self.on_select = on_select
+        self.tree = ttk.Treeview(self, columns=columns, show="headings", height=height, selectmode="browse")
+        for column, heading in zip(columns, headings):
+            self.tree.heading(column, text=heading, command=lambda column=column: self.sort_by(column))
+            self.tree.column(column, width=(widths or {}).get(column, 90), stretch=True)
+        self.scrollbar = ttk.Scrollbar(self, orient="vertical", command=self._on_scrollbar)
+        self.tree.pack(side="left", fill="both", expand=True)
+        self.scrollbar.pack(side="right", fill="y")
+
+        self._items = [self.tree.insert("", "end") for _ in range(height)]
+        self._indices = np.empty(0, dtype=np.int64)
+        self._top = 0
+        self._sort_column = None
+        self._descending = False
+        self.set_source(0, lambda indices: [])
+
+        self.tree.bind("<<TreeviewSelect>>", self._on_tree_select)
+        for widget in (self.tree, self.scrollbar):
+            widget.bind("<MouseWheel>", self._on_wheel)
+            widget.bind("<Button-4>", lambda event: self.scroll(-3))
+            widget.bind("<Button-5>", lambda event: self.scroll(3))
+        self.tree.bind("<Prior>", lambda event: self.scroll(-self.height))
+        self.tree.bind("<Next>", lambda event: self.scroll(self.height))
+
+    def set_source(self, count, row_values, sort_orders=None):
+        # `sort_orders` maps a column to a callable returning source indices in
+        # ascending order of that column; it is only called when sorting.
+        self.count = count
+        self.row_values = row_values
+        self.sort_orders = sort_orders or {}
+        self._order = None
+        self._sort_column = None
+        self._top = 0
+        self._refresh()
+
+    def sort_by(self, column):
+        if column not in self.sort_orders:
+            return
+        self._descending = column == self._sort_column and not self._descending
+        self._sort_column = column
+        order = np.asarray(self.sort_orders[column](), dtype=np.int64)
+        self._order = order[::-1] if self._descending else order
+        self._top = 0
+        self._refresh()
+
+    def scroll(self, rows):
+        self.scroll_to(self._top + rows)
+        return "break"
+
+    def scroll_to(self, top):
+        top = int(min(max(top, 0), max(self.count - self.height, 0)))
+        if top != self._top:
+            self._top = top
+            self._refresh()
+
+    def _refresh(self):
+        positions = np.arange(self._top, min(self._top + self.height, self.count))
+        self._indices = positions if self._order is None else self._order[positions]
+        values = self.row_values(self._indices) if len(self._indices) else []
+        self.tree.selection_remove(self.tree.selection())
+        for row, item in enumerate(self._items):
+            if row < len(values):
+                self.tree.item(item, values=values[row])
+                self.tree.move(item, "", row)
+            else:
+                self.tree.detach(item)
+        if self.count:
+            self.scrollbar.set(self._top / self.count, (self._top + len(self._indices)) / self.count)
+        else:
+            self.scrollbar.set(0, 1)
+
+    def _on_scrollbar(self, action, value, unit=None):
+        if action == "moveto":
+            self.scroll_to(round(float(value) * self.count))
+        elif action == "scroll":
+            self.scroll(int(value) * (self.height if unit == "pages" else 1))
+
+    def _on_wheel(self, event):
+        return self.scroll(-3 if event.delta > 0 else 3)
+
+    def _on_tree_select(self, event=None):
+        selection = self.tree.selection()
+        if not selection or self.on_select is None:
+            return
+        row = self._items.index(selection[0])
+        if row < len(self._indices):
+            self.on_select(int(self._indices[row]))
+
+
+def system_table(master, catalog, on_select, height=8):
+    table = VirtualTable(master, ("name", "distance", "luminosity", "temperature", "planets"),
+                         ("System", "Distance (ly)", "Luminosity", "Temp (K)", "Planets"), height,
+                         {"name": 180}, on_select)
+    show_systems(table, catalog)
+    return table
+
+
+def show_systems(table, catalog):
+    index = catalog.index
+    counts = catalog.planet_counts
+    table.set_source(len(catalog), system_rows(catalog), {
+        "name": lambda: index.name_search.sorted_positions,
+        "distance": lambda: index.systems["distance"].order,
+        "luminosity": lambda: index.systems["luminosity"].order,
+        "temperature": lambda: index.systems["temperature"].order,
+        "planets": lambda: np.argsort(counts, kind="stable"),
+    })
+
+
+def planet_table(master, on_select, height=6):
+    return VirtualTable(master, ("planet", "axis", "eccentricity", "mass", "period"),
+                        ("Planet", "a (AU)", "Eccentricity", "Mass", "Period (d)"), height,
+                        {"planet": 180}, on_select)
+
+
+def show_planets(table, catalog, system):
+    # Pages the planets of one system into a planet_table; indices passed to
+    # on_select are positions within the system.
+    planets = catalog.planet_slice(system)
+    axis = catalog.semi_major_axis[planets]
+
+    def numeric_order(column):
+        return lambda: np.argsort(column.value[planets], kind="stable")
+
+    table.set_source(len(axis), planet_rows(catalog, system), {
+        "axis": lambda: np.argsort(axis, kind="stable"),
+        "eccentricity": numeric_order(catalog.eccentricity),
+        "mass": numeric_order(catalog.mass),
+        "period": numeric_order(catalog.orbital_period),
+    })
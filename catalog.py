@@ -0,0 +1,273 @@
+import operator
+from collections.abc import Sequence
+from functools import cache, cached_property
+
+import numpy as np
+
+from catalog_index import CatalogIndex
+from habitable_zone import SIMPLE_MODEL, classify_planets
+from measurements import parse_column
+from orbits import time_in_hz_fraction
+
+STAR_COLUMNS = ("luminosity", "radius", "temperature", "distance")
+PLANET_TEXT_COLUMNS = ("planet_labels", "eccentricity", "status", "mass",
+                       "orbital_period_period_period_period")
+MISSING = "-"
+
+
+class Catalog:
+    # Struct-of-arrays catalog: one float64 array per star column and flattened
+    # planet columns, where planets of system i live in offsets[i]:offsets[i + 1].
+
+    def __init__(self, names, star_columns, offsets, semi_major_axis, planet_columns, issues=()):
+        self.names = _text_column(names)
+        self.star_columns = {
+            column: np.ascontiguousarray(star_columns[column], dtype=np.float64)
+            for column in STAR_COLUMNS
+        }
+        self.offsets = np.ascontiguousarray(offsets, dtype=np.int64)
+        self.semi_major_axis = np.ascontiguousarray(semi_major_axis, dtype=np.float64)
+        self.planet_columns = {
+            column: _text_column(planet_columns[column])
+            for column in PLANET_TEXT_COLUMNS
+        }
+        if len(self.offsets) != len(self.names) + 1 or self.offsets[-1] != len(self.semi_major_axis):
+            raise ValueError("Planet offsets do not match the number of systems and planets.")
+        # Data problems found and repaired while loading (validation.Issue)
+        self.issues = list(issues)
+
+    @classmethod
+    def from_systems(cls, systems, issues=()):
+        names = []
+        star_values = {column: [] for column in STAR_COLUMNS}
+        offsets = [0]
+        semi_major_axis = []
+        planet_values = {column: [] for column in PLANET_TEXT_COLUMNS}
+
+        for system in systems:
+            names.append(system["name"])
+            for column in STAR_COLUMNS:
+                star_values[column].append(system[column])
+            planets = system["exoplanets"]
+            semi_major_axis.extend(planets)
+            offsets.append(offsets[-1] + len(planets))
+            for column in PLANET_TEXT_COLUMNS:
+                planet_values[column].extend(_fit(system.get(column, []), len(planets)))
+
+        return cls(names, star_values, offsets, semi_major_axis, planet_values, issues)
+
+    def __len__(self):
+        return len(self.names)
+
+    @property
+    def luminosity(self):
+        return self.star_columns["luminosity"]
+
+    @property
+    def radius(self):
+        return self.star_columns["radius"]
+
+    @property
+    def temperature(self):
+        return self.star_columns["temperature"]
+
+    @property
+    def distance(self):
+        return self.star_columns["distance"]
+
+    @property
+    def planet_counts(self):
+        return np.diff(self.offsets)
+
+    @property
+    def planet_count(self):
+        return len(self.semi_major_axis)
+
+    @property
+    def planet_system(self):
+        # Index of the owning system for every flattened planet
+        return np.repeat(np.arange(len(self), dtype=np.int64), self.planet_counts)
+
+    def planet_slice(self, index):
+        return slice(int(self.offsets[index]), int(self.offsets[index + 1]))
+
+    def system(self, index):
+        planets = self.planet_slice(index)
+        system = {"name": self.names[index]}
+        for column in STAR_COLUMNS:
+            system[column] = self.star_columns[column][index].item()
+        system["exoplanets"] = self.semi_major_axis[planets].tolist()
+        for column in PLANET_TEXT_COLUMNS:
+            system[column] = self.planet_columns[column][planets].tolist()
+        return system
+
+    @property
+    def systems(self):
+        return SystemsView(self)
+
+    # Numeric planet columns, parsed from the text columns on first access and
+    # cached for the lifetime of the catalog (masses in Earth masses, periods in days).
+    @cached_property
+    def mass(self):
+        return parse_column(self.planet_columns["mass"])
+
+    @cached_property
+    def eccentricity(self):
+        return parse_column(self.planet_columns["eccentricity"])
+
+    @cached_property
+    def orbital_period(self):
+        return parse_column(self.planet_columns["orbital_period_period_period_period"])
+
+    @cached_property
+    def index(self):
+        return CatalogIndex(self)
+
+    @cached_property
+    def derived(self):
+        # Insolation, equilibrium temperature, HZ position and other columns
+        # computed from these on first access (see derived.py)
+        from derived import DerivedColumns
+
+        return DerivedColumns(self)
+
+    def set_column(self, column, values):
+        # Replaces a star column or semi_major_axis, dropping only what was
+        # computed from it
+        values = np.ascontiguousarray(values, dtype=np.float64)
+        if column == "semi_major_axis":
+            if values.shape != self.semi_major_axis.shape:
+                raise ValueError("semi_major_axis needs one value per planet.")
+            self.semi_major_axis = values
+        elif column in STAR_COLUMNS:
+            if values.shape != (len(self),):
+                raise ValueError(f"{column} needs one value per system.")
+            self.star_columns[column] = values
+        else:
+            raise KeyError(f"Unknown numeric column {column!r}.")
+        self.__dict__.pop("index", None)
+        if "derived" in self.__dict__:
+            self.derived.invalidate(column)
+
+    def classify(self, model=SIMPLE_MODEL, table=None):
+        return classify_planets(self.luminosity, self.semi_major_axis, self.planet_counts,
+                                self.temperature, model, table)
+
+    def time_in_hz(self, model=SIMPLE_MODEL, table=None):
+        # Fraction of each planet's orbit spent inside its star's HZ
+        bounds = self.classify(model, table)
+        return time_in_hz_fraction(self.semi_major_axis, self.eccentricity.value, bounds.inner, bounds.outer)
+
+
+def concatenate_arrays(parts, dtype):
+    # Joins per-chunk arrays, also when there are none
+    if not parts:
+        return np.empty(0, dtype=dtype)
+    return np.concatenate(parts).astype(dtype, copy=False)
+
+
+def concatenate_catalogs(catalogs):
+    # One catalog holding the systems of `catalogs` in order
+    catalogs = list(catalogs)
+    offsets = [np.zeros(1, dtype=np.int64)]
+    for catalog in catalogs:
+        offsets.append(catalog.offsets[1:] + offsets[-1][-1])
+
+    def text(values):
+        return np.concatenate([np.asarray(part, dtype=object) for part in values] or [np.empty(0, dtype=object)])
+
+    return Catalog(
+        text(catalog.names for catalog in catalogs),
+        {column: np.concatenate([catalog.star_columns[column] for catalog in catalogs] or [np.empty(0)])
+         for column in STAR_COLUMNS},
+        np.concatenate(offsets),
+        np.concatenate([catalog.semi_major_axis for catalog in catalogs] or [np.empty(0)]),
+        {column: text(catalog.planet_columns[column] for catalog in catalogs) for column in PLANET_TEXT_COLUMNS},
+        [issue for catalog in catalogs for issue in catalog.issues],
+    )
+
+
+@cache
+def load_default_catalog():
+    # Built on first use so importing this module does not pay for the bundled
+    # records, which are validated once here (see validation.py).
+    import systems_data
+    from validation import validate_systems
+
+    return Catalog.from_systems(*validate_systems(systems_data.planetary_systems))
+
+
+class SystemsView(Sequence):
+    # Read-only list-of-dicts view; each dict is built on access.
+
+    def __init__(self, catalog):
+        self.catalog = catalog
+
+    def __len__(self):
+        return len(self.catalog)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.catalog.system(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("system index out of range")
+        return self.catalog.system(index)
+
+
+class StringColumn(Sequence):
+    # Strings packed into one UTF-8 byte buffer with int64 boundaries, so a text
+    # column can be memory-mapped without creating a Python object per value.
+
+    def __init__(self, data, bounds):
+        self.data = data
+        self.bounds = bounds
+
+    @classmethod
+    def from_strings(cls, values):
+        encoded = [str(value).encode() for value in values]
+        bounds = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum([len(value) for value in encoded], out=bounds[1:])
+        return cls(np.frombuffer(b"".join(encoded), dtype=np.uint8), bounds)
+
+    def __len__(self):
+        return len(self.bounds) - 1
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                return np.asarray(self, dtype=object)[index]
+            stop = max(start, stop)
+            return StringColumn(self.data, self.bounds[start:stop + 1])
+        index = operator.index(index)
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("string column index out of range")
+        return self.data[self.bounds[index]:self.bounds[index + 1]].tobytes().decode()
+
+    def tolist(self):
+        if len(self) == 0:
+            return []
+        first = int(self.bounds[0])
+        blob = self.data[first:int(self.bounds[-1])].tobytes()
+        ends = (self.bounds - first).tolist()
+        return [blob[start:end].decode() for start, end in zip(ends, ends[1:])]
+
+    def __array__(self, dtype=None, copy=None):
+        return np.array(self.tolist(), dtype=object if dtype is None else dtype)
+
+
+def _text_column(values):
+    if isinstance(values, StringColumn):
+        return values
+    return np.asarray(values, dtype=object)
+
+
+def _fit(values, length):
+    # Some records list more or fewer values than planets; pad with MISSING so
+    # every planet column shares the same offsets.
+    values = list(values)[:length]
+    return values + [MISSING] * (length - len(values))
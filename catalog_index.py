@@ -0,0 +1,88 @@
+from functools import cached_property
+
+import numpy as np
+
+from habitable_zone import INSIDE_HZ, SIMPLE_MODEL
+from name_search import DEFAULT_LIMIT, NameSearchIndex
+
+SYSTEM_INDEX_COLUMNS = ("distance", "luminosity", "temperature")
+
+
+class SortedIndex:
+    # Positions of a column sorted by value, so range queries are two binary
+    # searches plus a slice.  NaNs sort last and never match a range.
+
+    def __init__(self, values):
+        values = np.asarray(values, dtype=np.float64)
+        self.order = np.argsort(values, kind="stable")
+        self.values = values[self.order]
+        self.valid = len(values) - int(np.isnan(values).sum())
+
+    def range(self, low=None, high=None, inclusive=True):
+        # Positions whose value lies between low and high (either may be None),
+        # ordered by value.
+        start = 0 if low is None else np.searchsorted(self.values[:self.valid], low, "left" if inclusive else "right")
+        stop = self.valid if high is None else np.searchsorted(self.values[:self.valid], high,
+                                                               "right" if inclusive else "left")
+        return self.order[start:max(start, stop)]
+
+
+class CatalogIndex:
+    # Query layer over a Catalog: sorted indexes on the star columns and on
+    # planet semi-major axis, and a name -> system hash index.  Queries return
+    # arrays of system or flattened planet indices.
+
+    def __init__(self, catalog):
+        self.catalog = catalog
+        self.systems = {column: SortedIndex(catalog.star_columns[column]) for column in SYSTEM_INDEX_COLUMNS}
+        self.semi_major_axis = SortedIndex(catalog.semi_major_axis)
+        self._names = {}
+        self._zones = {}  # HZ model -> zone of every planet
+        for index, name in enumerate(catalog.names):
+            self._names.setdefault(name, index)
+
+    def system_index(self, name):
+        return self._names[name]
+
+    def systems_in_range(self, column, low=None, high=None, inclusive=True):
+        return self.systems[column].range(low, high, inclusive)
+
+    def systems_within(self, distance):
+        return self.systems_in_range("distance", high=distance)
+
+    def planets_in_range(self, low=None, high=None, inclusive=True):
+        return self.semi_major_axis.range(low, high, inclusive)
+
+    def planets_of(self, systems):
+        # Flattened planet indices of the given systems, system by system
+        systems = np.asarray(systems, dtype=np.int64)
+        starts = self.catalog.offsets[systems]
+        counts = self.catalog.offsets[systems + 1] - starts
+        firsts = np.repeat(np.cumsum(counts) - counts, counts)
+        return np.repeat(starts, counts) + np.arange(int(counts.sum()), dtype=np.int64) - firsts
+
+    @cached_property
+    def name_search(self):
+        return NameSearchIndex(self.catalog.names)
+
+    def search_names(self, query, limit=DEFAULT_LIMIT):
+        return self.name_search.search(query, limit)
+
+    @cached_property
+    def population(self):
+        # Log-space points for the catalog-wide density view, built on first use
+        from population import PopulationIndex
+
+        return PopulationIndex.from_sorted(self.semi_major_axis,
+                                           np.repeat(self.catalog.luminosity, self.catalog.planet_counts))
+
+    def zones(self, model=SIMPLE_MODEL):
+        # Zone of every planet under `model`, classified once per model
+        zones = self._zones.get(model)
+        if zones is None:
+            zones = self._zones[model] = self.catalog.classify(model).zone
+        return zones
+
+    def planets_in_hz(self, systems=None, model=SIMPLE_MODEL):
+        planets = np.arange(self.catalog.planet_count) if systems is None else self.planets_of(systems)
+        return planets[self.zones(model)[planets] == INSIDE_HZ]
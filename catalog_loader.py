@@ -0,0 +1,185 @@
+import csv
+from itertools import islice
+
+import numpy as np
+
+from catalog import MISSING, STAR_COLUMNS, Catalog, concatenate_arrays, load_default_catalog
+from habitable_zone import SUN_TEMPERATURE
+from tracing import traced
+
+# Schema field -> column name in an Exoplanet Archive export.  The
+# "Planetary Systems" table (ps) has one row per planet per reference; only its
+# default_flag = 1 rows, one per planet, are used.  The composite table
+# (pscomppars) has one row per planet and no flag.
+ARCHIVE_COLUMNS = {
+    "default_flag": "default_flag",
+    "host": "hostname",
+    "planet": "pl_name",
+    "semi_major_axis": "pl_orbsmax",  # AU
+    "eccentricity": "pl_orbeccen",
+    "mass": "pl_bmasse",  # Earth masses
+    "orbital_period": "pl_orbper",  # days
+    "log_luminosity": "st_lum",  # log10(L / L_sun)
+    "radius": "st_rad",  # solar radii
+    "temperature": "st_teff",  # K
+    "distance": "sy_dist",  # parsecs
+}
+PARSEC_IN_LIGHT_YEARS = 3.26156
+DEFAULT_CHUNK_SIZE = 50_000
+
+# Catalog text column fed by each raw field
+_TEXT_FIELDS = {
+    "eccentricity": "eccentricity",
+    "mass": "mass",
+    "orbital_period_period_period_period": "orbital_period",
+}
+
+
+def iter_csv_chunks(path, columns=ARCHIVE_COLUMNS, chunk_size=DEFAULT_CHUNK_SIZE):
+    # Yields {field: [raw strings]} for at most `chunk_size` rows at a time.
+    # Archive exports start with '#' comment lines, which are skipped.
+    with open(path, newline="", encoding="utf-8") as file:
+        reader = csv.reader(line for line in file if not line.startswith("#"))
+        header = next(reader, None)
+        if header is None:
+            return
+        positions = {}
+        for field, column in columns.items():
+            if column in header:
+                positions[field] = header.index(column)
+        for required in ("host", "semi_major_axis"):
+            if required not in positions:
+                raise ValueError(f"Catalog file is missing the {columns[required]!r} column.")
+        while True:
+            rows = list(islice(reader, chunk_size))
+            if not rows:
+                return
+            yield {field: [row[position] if position < len(row) else "" for row in rows]
+                   for field, position in positions.items()}
+
+
+class CatalogBuilder:
+    # Builds a Catalog incrementally from row chunks that may list a host's
+    # planets anywhere in the file.  Rows are kept as typed arrays per chunk,
+    # never as per-system dicts, and grouped by host once in build().
+
+    def __init__(self):
+        self._host_index = {}
+        self._names = []
+        self._stars = {column: np.full(1024, np.nan) for column in STAR_COLUMNS}
+        self._planet_system = []
+        self._planet_names = []
+        self._semi_major_axis = []
+        self._planet_text = {column: [] for column in _TEXT_FIELDS}
+
+    def add_chunk(self, chunk):
+        flags = chunk.get("default_flag")
+        if flags is not None:
+            chunk = _default_rows(chunk, flags)
+        hosts = chunk["host"]
+        system = np.empty(len(hosts), dtype=np.int64)
+        for i, host in enumerate(hosts):
+            index = self._host_index.get(host)
+            if index is None:
+                index = self._host_index[host] = len(self._names)
+                self._names.append(host)
+            system[i] = index
+        self._reserve(len(self._names))
+
+        # The first row that reports a stellar value wins.  Within a chunk a
+        # host may repeat, and fancy assignment keeps the last write, so only
+        # each host's first reporting row is assigned.
+        for column, values in self._star_values(chunk).items():
+            stars = self._stars[column]
+            known = ~np.isnan(values) & np.isnan(stars[system])
+            reporting, first = np.unique(system[known], return_index=True)
+            stars[reporting] = values[known][first]
+
+        rows = len(hosts)
+        self._planet_system.append(system)
+        self._planet_names.append(np.asarray(chunk.get("planet", [""] * rows), dtype=object))
+        self._semi_major_axis.append(_floats(chunk["semi_major_axis"]))
+        for column, field in _TEXT_FIELDS.items():
+            text = np.asarray(chunk.get(field, [""] * rows), dtype=object)
+            text[text == ""] = MISSING
+            self._planet_text[column].append(text)
+
+    def build(self):
+        count = len(self._names)
+        system = concatenate_arrays(self._planet_system, np.int64)
+        order = np.argsort(system, kind="stable")
+        offsets = np.zeros(count + 1, dtype=np.int64)
+        np.cumsum(np.bincount(system, minlength=count), out=offsets[1:])
+
+        # Number planets within each system, matching the bundled "1. name" labels
+        names = concatenate_arrays(self._planet_names, object)[order]
+        position = np.arange(len(order)) - np.repeat(offsets[:-1], np.diff(offsets)) + 1
+        labels = np.array([f"{n}. {name}" for n, name in zip(position.tolist(), names)], dtype=object)
+
+        planet_columns = {column: concatenate_arrays(parts, object)[order] for column, parts in self._planet_text.items()}
+        planet_columns["planet_labels"] = labels
+        planet_columns["status"] = np.full(len(order), MISSING, dtype=object)
+        star_columns = {column: values[:count] for column, values in self._stars.items()}
+        return Catalog(self._names, star_columns, offsets,
+                       concatenate_arrays(self._semi_major_axis, np.float64)[order], planet_columns)
+
+    def _reserve(self, size):
+        capacity = len(self._stars["luminosity"])
+        if size <= capacity:
+            return
+        while capacity < size:
+            capacity *= 2
+        for column, values in self._stars.items():
+            grown = np.full(capacity, np.nan)
+            grown[:len(values)] = values
+            self._stars[column] = grown
+
+    @staticmethod
+    def _star_values(chunk):
+        rows = len(chunk["host"])
+        missing = [""] * rows
+        radius = _floats(chunk.get("radius", missing))
+        temperature = _floats(chunk.get("temperature", missing))
+        luminosity = 10 ** _floats(chunk.get("log_luminosity", missing))
+        # Stefan-Boltzmann estimate where the export has no luminosity
+        estimated = radius ** 2 * (temperature / SUN_TEMPERATURE) ** 4
+        luminosity = np.where(np.isnan(luminosity), estimated, luminosity)
+        distance = _floats(chunk.get("distance", missing)) * PARSEC_IN_LIGHT_YEARS
+        return {"luminosity": luminosity, "radius": radius, "temperature": temperature, "distance": distance}
+
+
+def load_csv(path, columns=ARCHIVE_COLUMNS, chunk_size=DEFAULT_CHUNK_SIZE):
+    builder = CatalogBuilder()
+    for chunk in iter_csv_chunks(path, columns, chunk_size):
+        builder.add_chunk(chunk)
+    return builder.build()
+
+
+@traced()
+def load_catalog(path=None, snapshot=True):
+    # The bundled records when no path is given, otherwise an archive CSV export.
+    # With `snapshot`, a memory-mapped binary snapshot is used while it matches
+    # the source file and rebuilt when it does not (see snapshot.py).
+    if not snapshot:
+        return load_default_catalog() if path is None else load_csv(path)
+
+    from snapshot import BUNDLED_SOURCE, load_or_build
+
+    if path is None:
+        return load_or_build(BUNDLED_SOURCE, load_default_catalog)
+    return load_or_build(path, lambda: load_csv(path))
+
+
+def _default_rows(chunk, flags):
+    # The rows of a "ps" export chunk that hold each planet's default solution
+    keep = np.char.strip(np.asarray(flags, dtype=str)) == "1"
+    if keep.all():
+        return chunk
+    return {field: np.asarray(values, dtype=object)[keep].tolist() for field, values in chunk.items()}
+
+
+def _floats(values):
+    # np.where, not assignment: an all-blank column is too narrow to hold "nan"
+    values = np.char.strip(np.asarray(values, dtype=str))
+    values = np.where(values == "", "nan", values)
+    return values.astype(np.float64)
@@ -0,0 +1,295 @@
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from collections import namedtuple
+from itertools import chain, islice
+
+import numpy as np
+
+from catalog import MISSING, Catalog, concatenate_arrays, concatenate_catalogs
+
+# Fields of a custom system record.  In CSV the list fields hold
+# comma-separated values, as in the GUI's custom entry; in JSON Lines they
+# may be lists or such strings.
+FIELDS = ("name", "luminosity", "temperature", "radius", "distance", "exoplanets", "planet_labels")
+LIST_FIELDS = ("exoplanets", "planet_labels")
+JSON_EXTENSIONS = (".jsonl", ".ndjson", ".json")
+DEFAULT_CHUNK_SIZE = 50_000
+CUSTOM_STATUS = "Custom"
+# Line numbers kept per problem for the report
+EXAMPLE_LINES = 5
+
+# Rejection reasons, in the order they are checked; a record is reported
+# under the first one it fails.
+INVALID_JSON = "invalid JSON"
+MISSING_NAME = "missing name"
+BAD_LUMINOSITY = "non-numeric luminosity"
+NONPOSITIVE_LUMINOSITY = "missing or non-positive luminosity"
+BAD_TEMPERATURE = "non-numeric temperature"
+NONPOSITIVE_TEMPERATURE = "non-positive temperature"
+BAD_STAR_VALUE = "non-numeric radius or distance"
+NO_PLANETS = "no planets"
+BAD_AXIS = "non-numeric semi-major axis"
+NONPOSITIVE_AXIS = "non-positive semi-major axis"
+LABEL_MISMATCH = "label/axis count mismatch"
+# Names must stay unique across the catalog being imported into, earlier
+# files and earlier records, as the name index assumes (see validation.py)
+DUPLICATE_NAME = "duplicate name"
+REASONS = (INVALID_JSON, MISSING_NAME, BAD_LUMINOSITY, NONPOSITIVE_LUMINOSITY, BAD_TEMPERATURE,
+           NONPOSITIVE_TEMPERATURE, BAD_STAR_VALUE, NO_PLANETS, BAD_AXIS, NONPOSITIVE_AXIS, LABEL_MISMATCH,
+           DUPLICATE_NAME)
+
+ImportReport = namedtuple("ImportReport", ["catalog", "imported", "rejected", "problems"])
+Problem = namedtuple("Problem", ["count", "lines"])
+
+
+def iter_record_chunks(path, chunk_size=DEFAULT_CHUNK_SIZE):
+    # Yields (line numbers, {field: values}, unreadable line numbers) for at
+    # most `chunk_size` records at a time.  Scalar fields are strings; list
+    # fields are lists of strings.
+    if path.lower().endswith(JSON_EXTENSIONS):
+        yield from _json_chunks(path, chunk_size)
+    else:
+        yield from _csv_chunks(path, chunk_size)
+
+
+def _csv_chunks(path, chunk_size):
+    with open(path, newline="", encoding="utf-8") as file:
+        # Comment lines are counted so reported line numbers match the file
+        skipped = [0]
+
+        def content():
+            for line in file:
+                if line.startswith("#"):
+                    skipped[0] += 1
+                else:
+                    yield line
+
+        reader = csv.reader(content())
+        header = next(reader, None)
+        if header is None:
+            return
+        header = [column.strip() for column in header]
+        missing = [field for field in ("name", "luminosity", "exoplanets") if field not in header]
+        if missing:
+            raise ValueError(f"Custom systems file is missing the {', '.join(missing)} column(s).")
+        positions = {field: header.index(field) for field in FIELDS if field in header}
+        while True:
+            rows = list(islice(((reader.line_num + skipped[0], row) for row in reader), chunk_size))
+            if not rows:
+                return
+            chunk = {field: [row[position] if position < len(row) else "" for _, row in rows]
+                     for field, position in positions.items()}
+            for field in FIELDS:
+                chunk.setdefault(field, [""] * len(rows))
+            for field in LIST_FIELDS:
+                chunk[field] = [_split(text) for text in chunk[field]]
+            yield [line for line, _ in rows], chunk, []
+
+
+def _json_chunks(path, chunk_size):
+    with open(path, encoding="utf-8") as file:
+        lines = ((number, text) for number, text in enumerate(file, 1) if text.strip())
+        while True:
+            batch = list(islice(lines, chunk_size))
+            if not batch:
+                return
+            numbers, records, invalid = [], [], []
+            for number, text in batch:
+                try:
+                    record = json.loads(text)
+                except json.JSONDecodeError:
+                    record = None
+                if isinstance(record, dict):
+                    numbers.append(number)
+                    records.append(record)
+                else:
+                    invalid.append(number)
+            chunk = {field: [_scalar(record.get(field)) for record in records] for field in FIELDS}
+            for field in LIST_FIELDS:
+                chunk[field] = [_values(record.get(field)) for record in records]
+            yield numbers, chunk, invalid
+
+
+def _split(text):
+    # Values are stripped later, in bulk
+    return text.split(",") if text and not text.isspace() else []
+
+
+def _scalar(value):
+    return "" if value is None else str(value)
+
+
+def _values(value):
+    if value is None:
+        return []
+    if isinstance(value, str):
+        return _split(value)
+    if isinstance(value, (list, tuple)):
+        return [_scalar(item) for item in value]
+    return [_scalar(value)]
+
+
+def _numbers(values):
+    # float64 values plus a mask of entries that are not numbers; blanks are
+    # NaN and not flagged.  The whole batch is converted at once and only a
+    # batch containing bad values is re-parsed value by value.
+    text = np.char.strip(np.asarray(values, dtype=str))
+    text = np.where(text == "", "nan", text)
+    try:
+        return text.astype(np.float64), np.zeros(len(text), dtype=bool)
+    except ValueError:
+        numbers = np.full(len(text), np.nan)
+        bad = np.zeros(len(text), dtype=bool)
+        for i, item in enumerate(text.tolist()):
+            try:
+                numbers[i] = float(item)
+            except ValueError:
+                bad[i] = True
+        return numbers, bad
+
+
+class CustomSystemsBuilder:
+    # Validates record chunks and keeps the accepted systems as typed arrays
+    # until build(); rejected records are only counted, with a few line numbers.
+    # `existing_names` are names already taken in the target catalog.
+
+    def __init__(self, existing_names=()):
+        self._taken = set(existing_names)
+        self._names = []
+        self._stars = {column: [] for column in ("luminosity", "radius", "temperature", "distance")}
+        self._counts = []
+        self._semi_major_axis = []
+        self._labels = []
+        self._problems = {reason: [0, []] for reason in REASONS}
+
+    def add_chunk(self, lines, chunk, invalid=()):
+        self._reject(INVALID_JSON, np.asarray(invalid, dtype=np.int64))
+        lines = np.asarray(lines, dtype=np.int64)
+        names = np.char.strip(np.asarray(chunk["name"], dtype=str))
+        luminosity, bad_luminosity = _numbers(chunk["luminosity"])
+        temperature, bad_temperature = _numbers(chunk["temperature"])
+        radius, bad_radius = _numbers(chunk["radius"])
+        distance, bad_distance = _numbers(chunk["distance"])
+
+        # Planet values of the whole chunk flattened, with their record index
+        axes = chunk["exoplanets"]
+        counts = np.fromiter(map(len, axes), dtype=np.int64, count=len(axes))
+        label_counts = np.fromiter(map(len, chunk["planet_labels"]), dtype=np.int64, count=len(axes))
+        record = np.repeat(np.arange(len(axes)), counts)
+        semi_major_axis, bad_axis = _numbers(list(chain.from_iterable(axes)))
+        nonpositive_axis = ~(semi_major_axis > 0) | ~np.isfinite(semi_major_axis)
+
+        checks = (
+            (MISSING_NAME, names == ""),
+            (BAD_LUMINOSITY, bad_luminosity),
+            (NONPOSITIVE_LUMINOSITY, ~(luminosity > 0) | ~np.isfinite(luminosity)),
+            (BAD_TEMPERATURE, bad_temperature),
+            (NONPOSITIVE_TEMPERATURE, temperature <= 0),
+            (BAD_STAR_VALUE, bad_radius | bad_distance),
+            (NO_PLANETS, counts == 0),
+            (BAD_AXIS, np.bincount(record, bad_axis, len(axes)) > 0),
+            (NONPOSITIVE_AXIS, np.bincount(record, nonpositive_axis, len(axes)) > 0),
+            (LABEL_MISMATCH, (label_counts > 0) & (label_counts != counts)),
+        )
+        valid = np.ones(len(axes), dtype=bool)
+        for reason, failed in checks:
+            failed = failed & valid
+            self._reject(reason, lines[failed])
+            valid &= ~failed
+
+        # Checked last and in record order, so the first valid record of a name wins
+        duplicate = np.zeros(len(axes), dtype=bool)
+        for i in np.flatnonzero(valid).tolist():
+            if names[i] in self._taken:
+                duplicate[i] = True
+            else:
+                self._taken.add(names[i])
+        self._reject(DUPLICATE_NAME, lines[duplicate])
+        valid &= ~duplicate
+
+        accepted = np.flatnonzero(valid)
+        self._names.extend(names[accepted].tolist())
+        for column, values in (("luminosity", luminosity), ("radius", radius), ("temperature", temperature),
+                               ("distance", distance)):
+            self._stars[column].append(values[accepted])
+        self._counts.append(counts[accepted])
+        self._semi_major_axis.append(semi_major_axis[valid[record]])
+        labels = chunk["planet_labels"]
+        for i in accepted.tolist():
+            self._labels.extend(labels[i] or [f"{n}. {names[i]}" for n in range(1, counts[i] + 1)])
+
+    def build(self):
+        counts = concatenate_arrays(self._counts, np.int64)
+        offsets = np.zeros(len(counts) + 1, dtype=np.int64)
+        np.cumsum(counts, out=offsets[1:])
+        planets = int(offsets[-1])
+        planet_columns = {column: np.full(planets, MISSING, dtype=object)
+                          for column in ("eccentricity", "mass", "orbital_period_period_period_period")}
+        planet_columns["status"] = np.full(planets, CUSTOM_STATUS, dtype=object)
+        planet_columns["planet_labels"] = np.char.strip(np.asarray(self._labels, dtype=str)).astype(object)
+        star_columns = {column: concatenate_arrays(parts, np.float64) for column, parts in self._stars.items()}
+        catalog = Catalog(self._names, star_columns, offsets, concatenate_arrays(self._semi_major_axis, np.float64),
+                          planet_columns)
+        problems = {reason: Problem(count, lines) for reason, (count, lines) in self._problems.items() if count}
+        return ImportReport(catalog, len(catalog), sum(problem.count for problem in problems.values()), problems)
+
+    def _reject(self, reason, lines):
+        problem = self._problems[reason]
+        problem[0] += len(lines)
+        problem[1].extend(lines[:EXAMPLE_LINES - len(problem[1])].tolist())
+
+
+def import_systems(path, chunk_size=DEFAULT_CHUNK_SIZE, existing_names=()):
+    # Streams a CSV or JSON Lines file of custom systems into an ImportReport
+    # whose catalog holds the accepted systems; see concatenate_catalogs to
+    # join them to another catalog, whose names go in `existing_names`.
+    builder = CustomSystemsBuilder(existing_names)
+    for lines, chunk, invalid in iter_record_chunks(path, chunk_size):
+        builder.add_chunk(lines, chunk, invalid)
+    return builder.build()
+
+
+def import_into(catalog, paths, chunk_size=DEFAULT_CHUNK_SIZE):
+    # `catalog` with the accepted systems of every file appended, and the reports
+    taken = set(catalog.names)
+    reports = []
+    for path in paths:
+        reports.append(import_systems(path, chunk_size, taken))
+        taken.update(reports[-1].catalog.names)
+    return concatenate_catalogs([catalog, *(report.catalog for report in reports)]), reports
+
+
+def format_report(report, source=None):
+    # A few lines summarizing an ImportReport, one per kind of problem
+    header = f"Imported {report.imported} systems" + (f" from {os.path.basename(source)}" if source else "")
+    if not report.rejected:
+        return header + "."
+    lines = [f"{header}; rejected {report.rejected}:"]
+    for reason, problem in report.problems.items():
+        more = ", ..." if problem.count > len(problem.lines) else ""
+        lines.append(f"  {reason}: {problem.count} (line {', '.join(map(str, problem.lines))}{more})")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Validate and import custom systems from CSV or JSON Lines files.")
+    parser.add_argument("paths", nargs="+")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    args = parser.parse_args(argv)
+
+    status = 0
+    for path in args.paths:
+        start = time.perf_counter()
+        report = import_systems(path, args.chunk_size)
+        print(format_report(report, path))
+        print(f"  {report.catalog.planet_count} planets in {time.perf_counter() - start:.2f} s")
+        status = status or int(report.rejected > 0)
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
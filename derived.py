@@ -0,0 +1,132 @@
+import numpy as np
+
+from habitable_zone import SIMPLE_MODEL, SUN_TEMPERATURE, hz_bounds
+
+# Bond albedo assumed for equilibrium temperatures
+DEFAULT_ALBEDO = 0.3
+# Equilibrium temperature (K) of a zero-albedo planet receiving Earth's insolation
+EARTH_FLUX_TEMPERATURE = 278.6
+# Catalog luminosities further than this factor from the Stefan-Boltzmann
+# estimate are flagged
+LUMINOSITY_TOLERANCE = 3.0
+
+
+def _planet_luminosity(catalog, columns):
+    return np.repeat(catalog.luminosity, catalog.planet_counts)
+
+
+def _insolation(catalog, columns):
+    # Stellar flux at the planet in units of Earth's: L / a^2
+    with np.errstate(divide="ignore"):
+        return columns["planet_luminosity"] / catalog.semi_major_axis ** 2
+
+
+def _equilibrium_temperature(catalog, columns):
+    return EARTH_FLUX_TEMPERATURE * ((1 - columns.albedo) * columns["insolation"]) ** 0.25
+
+
+def _hz_inner(catalog, columns):
+    return hz_bounds(catalog.luminosity, catalog.temperature, columns.hz_model)[0]
+
+
+def _hz_outer(catalog, columns):
+    return hz_bounds(catalog.luminosity, catalog.temperature, columns.hz_model)[1]
+
+
+def _hz_position(catalog, columns):
+    # 0 at the inner HZ edge and 1 at the outer one; < 0 too hot, > 1 too cold
+    counts = catalog.planet_counts
+    inner = np.repeat(columns["hz_inner"], counts)
+    outer = np.repeat(columns["hz_outer"], counts)
+    return (catalog.semi_major_axis - inner) / (outer - inner)
+
+
+def _stefan_boltzmann_luminosity(catalog, columns):
+    return catalog.radius ** 2 * (catalog.temperature / SUN_TEMPERATURE) ** 4
+
+
+def _luminosity_ratio(catalog, columns):
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return catalog.luminosity / columns["stefan_boltzmann_luminosity"]
+
+
+def _luminosity_outlier(catalog, columns):
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.abs(np.log(columns["luminosity_ratio"])) > np.log(LUMINOSITY_TOLERANCE)
+
+
+# Derived column -> (inputs, function(catalog, columns)).  Inputs are catalog
+# columns ("luminosity", "semi_major_axis", ...), settings of DerivedColumns
+# ("albedo", "hz_model") or other derived columns.  Columns ending up per
+# planet or per system follow from their inputs.
+DERIVED_COLUMNS = {
+    "planet_luminosity": (("luminosity",), _planet_luminosity),
+    "insolation": (("planet_luminosity", "semi_major_axis"), _insolation),
+    "equilibrium_temperature": (("insolation", "albedo"), _equilibrium_temperature),
+    "hz_inner": (("luminosity", "temperature", "hz_model"), _hz_inner),
+    "hz_outer": (("luminosity", "temperature", "hz_model"), _hz_outer),
+    "hz_position": (("hz_inner", "hz_outer", "semi_major_axis"), _hz_position),
+    "stefan_boltzmann_luminosity": (("radius", "temperature"), _stefan_boltzmann_luminosity),
+    "luminosity_ratio": (("luminosity", "stefan_boltzmann_luminosity"), _luminosity_ratio),
+    "luminosity_outlier": (("luminosity_ratio",), _luminosity_outlier),
+}
+
+
+class DerivedColumns:
+    # Whole-catalog derived columns, computed on first access and memoized.
+    # invalidate(name) forgets only the columns that depend on `name`, so
+    # changing one input keeps unrelated columns cached.
+
+    def __init__(self, catalog, albedo=DEFAULT_ALBEDO, hz_model=SIMPLE_MODEL):
+        self.catalog = catalog
+        self._albedo = albedo
+        self._hz_model = hz_model
+        self._values = {}
+        self._dependents = {}
+        for name, (inputs, _) in DERIVED_COLUMNS.items():
+            for column in inputs:
+                self._dependents.setdefault(column, []).append(name)
+
+    def __getitem__(self, name):
+        values = self._values.get(name)
+        if values is None:
+            if name not in DERIVED_COLUMNS:
+                raise KeyError(f"Unknown derived column {name!r}.")
+            values = self._values[name] = DERIVED_COLUMNS[name][1](self.catalog, self)
+        return values
+
+    def __contains__(self, name):
+        return name in DERIVED_COLUMNS
+
+    @property
+    def cached(self):
+        # Names of the columns computed so far
+        return tuple(self._values)
+
+    @property
+    def albedo(self):
+        return self._albedo
+
+    @albedo.setter
+    def albedo(self, albedo):
+        self._albedo = albedo
+        self.invalidate("albedo")
+
+    @property
+    def hz_model(self):
+        return self._hz_model
+
+    @hz_model.setter
+    def hz_model(self, hz_model):
+        self._hz_model = hz_model
+        self.invalidate("hz_model")
+
+    def invalidate(self, name):
+        # Drops every memoized column that depends on `name`, directly or not.
+        # A column is only cached while its inputs are, so the walk can stop
+        # at columns that are not cached.
+        pending = [name]
+        while pending:
+            for dependent in self._dependents.get(pending.pop(), ()):
+                if self._values.pop(dependent, None) is not None:
+                    pending.append(dependent)
@@ -0,0 +1,74 @@
+# Text for the system browser and detail panes, kept free of tkinter so
+# it can be used and benchmarked without a display
+from habitable_zone import SIMPLE_MODEL, hz_bounds
+from orbits import time_in_hz_fraction
+
+
+def system_rows(catalog):
+    # row_values callable for a system_table
+    counts = catalog.planet_counts
+
+    def rows(indices):
+        return [(catalog.names[i], f"{catalog.distance[i]:g}", f"{catalog.luminosity[i]:g}",
+                 f"{catalog.temperature[i]:g}", int(counts[i])) for i in indices]
+    return rows
+
+
+def planet_rows(catalog, system):
+    # row_values callable for a planet_table showing `system`; indices are
+    # positions within the system
+    planets = catalog.planet_slice(system)
+    columns = catalog.planet_columns
+    axis = catalog.semi_major_axis[planets]
+
+    def rows(indices):
+        return [(columns["planet_labels"][planets.start + i], f"{axis[i]:g}",
+                 columns["eccentricity"][planets.start + i], columns["mass"][planets.start + i],
+                 columns["orbital_period_period_period_period"][planets.start + i]) for i in indices]
+    return rows
+
+
+def system_details(catalog, index):
+    details = (
+        f"Name: {catalog.names[index]}\n"
+        f"Radius: {catalog.radius[index]} Solar radius\n"
+        f"Temperature: {catalog.temperature[index]} K\n"
+        f"Luminosity: {catalog.luminosity[index]} Solar luminosity\n"
+        f"Distance: {catalog.distance[index]} light years"
+    )
+    derived = catalog.derived
+    if derived["luminosity_outlier"][index]:
+        details += (f"\nWarning: luminosity is {derived['luminosity_ratio'][index]:.3g} x the "
+                    f"radius/temperature estimate ({derived['stefan_boltzmann_luminosity'][index]:.3g})")
+    return details
+
+
+def exoplanet_details(catalog, system_index, position, hz_model=SIMPLE_MODEL):
+    # Read from the columns directly so systems with many planets do not
+    # build their whole dict for one row
+    planet = catalog.planet_slice(system_index).start + position
+    columns = catalog.planet_columns
+
+    planet_name = columns['planet_labels'][planet]
+    eccentricity = columns['eccentricity'][planet]
+    status = columns['status'][planet]
+    mass = columns['mass'][planet]
+    orbital_period = columns['orbital_period_period_period_period'][planet]
+
+    inner, outer = hz_bounds(catalog.luminosity[system_index], catalog.temperature[system_index], hz_model)
+    time_in_hz = time_in_hz_fraction(catalog.semi_major_axis[planet], catalog.eccentricity.value[planet],
+                                     inner, outer)[0]
+    derived = catalog.derived
+
+    return (
+        f"Planet: {planet_name}\n"
+        f"Eccentricity: {eccentricity}\n"
+        f"Status: {status}\n"
+        f"Mass: {mass}\n"
+        f"Orbital Period: {orbital_period} days\n"
+        f"Time in HZ: {time_in_hz:.0%} of the orbit\n"
+        f"Insolation: {derived['insolation'][planet]:.3g} x Earth\n"
+        f"Equilibrium Temperature: {derived['equilibrium_temperature'][planet]:.0f} K "
+        f"(albedo {derived.albedo})\n"
+        f"HZ Position: {derived['hz_position'][planet]:.2f} (0 inner edge, 1 outer edge)"
+    )
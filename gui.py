@@ -0,0 +1,311 @@
+import tkinter as tk
+from tkinter import filedialog, ttk, messagebox
+
+import numpy as np
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+from matplotlib.figure import Figure
+
+from browser import planet_table, show_planets, show_systems, system_table
+from catalog import concatenate_catalogs
+from catalog_loader import load_catalog
+from custom_import import format_report, import_systems
+from details import exoplanet_details, system_details
+from habitable_zone import HZ_MODELS, SIMPLE_MODEL
+from plotting import SystemPlot
+from population import PopulationPlot
+from render_cache import RenderCache
+from render_worker import BackgroundRenderer
+from tracing import span, traced
+
+SEARCH_DEBOUNCE_MS = 120
+RENDER_POLL_MS = 15
+
+
+class HabitableZoneApp:
+
+    def __init__(self, root, catalog):
+        self.root = root
+        self.catalog = catalog
+        self.planetary_systems = catalog.systems  # dicts are built from the columnar catalog on access
+
+        root.title("Habitable Zone Mapping")
+        root.geometry("1500x1000")  # Room for the controls and the embedded plot
+        root.configure(bg="#f0f0f0")  # Set background color
+
+        # A single embedded canvas is reused for every system; selections only
+        # update its artists instead of opening a new figure.
+        self.system_plot = SystemPlot(Figure(figsize=(7, 7)), blit=True)
+        self.canvas = FigureCanvasTkAgg(self.system_plot.figure, master=root)
+        self.canvas.get_tk_widget().pack(side="right", fill="both", expand=True)
+        self.canvas.draw()
+        self._plotted_index = None  # catalog index currently on the canvas, None for custom data
+
+        # Systems are drawn on a worker thread and the finished pixels blitted
+        # into the canvas, so large systems do not freeze the window.  The
+        # embedded SystemPlot is still updated (without drawing) so hover and
+        # animation work on the same state.
+        self.renderer = BackgroundRenderer(RenderCache())
+        self.render_status = tk.Label(root, text="", font=("Helvetica", 10), bg="#f0f0f0", fg="#666")
+        self.render_status.pack(side="bottom", anchor="e", padx=10)
+        root.after(RENDER_POLL_MS, self.poll_render)
+
+        font_large = ("Helvetica", 14)
+        header_label = tk.Label(root, text="Habitable Zone Mapping", font=("Helvetica", 20, "bold"), bg="#f0f0f0", fg="#333")
+        header_label.pack(pady=20)
+        system_frame = tk.Frame(root, bg="#f0f0f0")
+        system_frame.pack(pady=10, padx=20, fill="x")
+
+        system_label = tk.Label(system_frame, text="Select a Planetary System:", font=font_large, bg="#f0f0f0")
+        system_label.pack(anchor="w")
+
+        # The dropdown lists the current search matches; typing filters them
+        # through the catalog's name index once typing pauses.
+        self._visible_systems = catalog.index.search_names("")
+        self._search_job = None
+        self._shown_system = None  # catalog index whose details are displayed
+        self.system_combobox = ttk.Combobox(system_frame, values=[catalog.names[i] for i in self._visible_systems], font=font_large)
+        self.system_combobox.bind("<KeyRelease>", self.schedule_system_search)
+        self.system_combobox.pack(fill="x", pady=5)
+
+        # Sortable browser over the whole catalog; only the visible rows exist
+        # as widgets and they are filled from the columns while scrolling.
+        self.system_table = system_table(system_frame, catalog, self.browse_system)
+        self.system_table.pack(fill="x", pady=5)
+
+        hz_model_label = tk.Label(system_frame, text="Habitable Zone Model:", font=font_large, bg="#f0f0f0")
+        hz_model_label.pack(anchor="w")
+
+        self.hz_model_combobox = ttk.Combobox(system_frame, values=HZ_MODELS, font=font_large, state="readonly")
+        self.hz_model_combobox.set(SIMPLE_MODEL)
+        self.hz_model_combobox.bind("<<ComboboxSelected>>", self.select_hz_model)
+        self.hz_model_combobox.pack(fill="x", pady=5)
+
+        select_button = tk.Button(system_frame, text="Show System Details", command=self.select_planetary_system, font=font_large, bg="#4CAF50", fg="white")
+        select_button.pack(pady=10)
+
+        animate_button = tk.Button(system_frame, text="Animate Orbits", command=self.animate_orbits, font=font_large, bg="#4CAF50", fg="white")
+        animate_button.pack(pady=(0, 10))
+
+        population_button = tk.Button(system_frame, text="Population View", command=self.show_population, font=font_large, bg="#4CAF50", fg="white")
+        population_button.pack(pady=(0, 10))
+
+        details_frame = tk.Frame(root, bg="#f0f0f0")
+        details_frame.pack(pady=10, padx=20, fill="x")
+
+        self.details_label = tk.Label(details_frame, text="", font=("Helvetica", 12), justify="left", bg="#f0f0f0", anchor="w")
+        self.details_label.pack(fill="x")
+
+        exoplanet_frame = tk.Frame(root, bg="#f0f0f0")
+        exoplanet_frame.pack(pady=10, padx=20, fill="x")
+
+        exoplanet_label = tk.Label(exoplanet_frame, text="Select an Exoplanet:", font=font_large, bg="#f0f0f0")
+        exoplanet_label.pack(anchor="w")
+
+        self.planet_table = planet_table(exoplanet_frame, self.select_exoplanet)
+        self.planet_table.pack(fill="x", pady=5)
+
+        self.exoplanet_data_label = tk.Label(exoplanet_frame, text="", font=("Helvetica", 12), justify="left", bg="#f0f0f0", anchor="w")
+        self.exoplanet_data_label.pack(fill="x")
+
+        custom_frame = tk.Frame(root, bg="#f0f0f0")
+        custom_frame.pack(pady=20, padx=20, fill="x")
+
+        custom_label = tk.Label(custom_frame, text="Or Enter Custom Data:", font=font_large, bg="#f0f0f0")
+        custom_label.pack(anchor="w")
+
+        luminosity_label = tk.Label(custom_frame, text="Luminosity (in Solar luminosity):", font=font_large, bg="#f0f0f0")
+        luminosity_label.pack(anchor="w")
+        self.luminosity_entry = tk.Entry(custom_frame, font=font_large)
+        self.luminosity_entry.pack(fill="x", pady=5)
+
+        exoplanets_label = tk.Label(custom_frame, text="Exoplanets (comma-separated, in AU):", font=font_large, bg="#f0f0f0")
+        exoplanets_label.pack(anchor="w")
+        self.exoplanets_entry = tk.Entry(custom_frame, font=font_large)
+        self.exoplanets_entry.pack(fill="x", pady=5)
+
+        planet_labels_label = tk.Label(custom_frame, text="Planet Labels (comma-separated):", font=font_large, bg="#f0f0f0")
+        planet_labels_label.pack(anchor="w")
+        self.planet_labels_entry = tk.Entry(custom_frame, font=font_large)
+        self.planet_labels_entry.pack(fill="x", pady=5)
+
+        temperature_label = tk.Label(custom_frame, text="Stellar Temperature (K, needed by the kopparapu model):", font=font_large, bg="#f0f0f0")
+        temperature_label.pack(anchor="w")
+        self.temperature_entry = tk.Entry(custom_frame, font=font_large)
+        self.temperature_entry.pack(fill="x", pady=5)
+
+        plot_button = tk.Button(custom_frame, text="Plot Custom Data", command=self.plot_custom_data, font=font_large, bg="#4CAF50", fg="white")
+        plot_button.pack(pady=10)
+
+        import_button = tk.Button(custom_frame, text="Import Systems from File...", command=self.import_custom_systems, font=font_large, bg="#4CAF50", fg="white")
+        import_button.pack(pady=(0, 10))
+
+        self.import_report_label = tk.Label(custom_frame, text="", font=("Helvetica", 10), justify="left", bg="#f0f0f0", anchor="w")
+        self.import_report_label.pack(fill="x")
+
+    def schedule_system_search(self, event=None):
+        if event is not None and event.keysym in ("Up", "Down", "Return", "Escape", "Tab"):
+            return
+        if self._search_job is not None:
+            self.root.after_cancel(self._search_job)
+        self._search_job = self.root.after(SEARCH_DEBOUNCE_MS, self.filter_systems)
+
+    @traced()
+    def filter_systems(self):
+        self._search_job = None
+        self._visible_systems = self.catalog.index.search_names(self.system_combobox.get())
+        self.system_combobox['values'] = [self.catalog.names[i] for i in self._visible_systems]
+
+    def selected_system(self):
+        # Catalog index of the system in the selector, or -1
+        current = self.system_combobox.current()
+        if current != -1:
+            return int(self._visible_systems[current])
+        try:
+            return self.catalog.index.system_index(self.system_combobox.get().strip())
+        except KeyError:
+            return -1
+
+    def browse_system(self, index):
+        self.system_combobox.set(self.catalog.names[index])
+        self.show_system(index)
+
+    @traced()
+    def select_planetary_system(self):
+        selected_index = self.selected_system()
+        if selected_index == -1:
+            messagebox.showerror("Error", "Please select a planetary system.")
+            return
+        self.show_system(selected_index)
+
+    @traced()
+    def show_system(self, selected_index):
+        self.details_label.config(text=system_details(self.catalog, selected_index))
+        self._shown_system = selected_index
+
+        show_planets(self.planet_table, self.catalog, selected_index)
+
+        self.exoplanet_data_label.config(text="")
+
+        # Re-selecting the system already on screen needs no redraw
+        if selected_index != self._plotted_index:
+            planets = self.catalog.planet_slice(selected_index)
+            self.render_system(self.catalog.luminosity[selected_index], self.catalog.semi_major_axis[planets],
+                               self.catalog.planet_columns['planet_labels'][planets],
+                               self.catalog.temperature[selected_index])
+            self._plotted_index = selected_index
+
+    def render_system(self, luminosity, exoplanets, planet_labels, temperature=None):
+        self.system_plot.update(luminosity, exoplanets, planet_labels, redraw=False, temperature=temperature)
+        figure = self.system_plot.figure
+        self.renderer.submit(luminosity, exoplanets, planet_labels, temperature, figure.get_size_inches(),
+                             figure.dpi, self.system_plot.hz_model)
+
+    def poll_render(self):
+        result = self.renderer.poll()
+        if result is not None:
+            if result.error is not None:
+                messagebox.showerror("Error", f"Could not draw the system: {result.error}")
+            elif not self.show_rendered(result):
+                # The canvas was resized while rendering; draw it here instead
+                self.canvas.draw_idle()
+            stats = self.renderer.stats
+            self.render_status.config(text=f"Render {result.latency * 1000:.0f} ms "
+                                           f"(mean {stats.mean_latency * 1000:.0f} ms), "
+                                           f"queue {stats.queue_depth}, dropped {stats.dropped}")
+        self.root.after(RENDER_POLL_MS, self.poll_render)
+
+    def show_rendered(self, result):
+        # Copies the worker's pixels into the canvas's own Agg buffer and
+        # blits it, so later partial blits (hover, animation) restore
+        # backgrounds that match the screen.  False if the sizes differ.
+        buffer = np.asarray(self.canvas.get_renderer().buffer_rgba())
+        if result.image.shape != buffer.shape:
+            return False
+        with span("blit", latency_ms=result.latency * 1000):
+            buffer[...] = result.image
+            self.canvas.blit()
+        return True
+
+    @traced()
+    def animate_orbits(self):
+        selected_index = self.selected_system()
+        if selected_index == -1:
+            messagebox.showerror("Error", "Please select a planetary system.")
+            return
+        if selected_index != self._plotted_index:
+            self.show_system(selected_index)
+
+        # A render still in flight would overwrite the animation frames
+        self.renderer.cancel()
+        planets = self.catalog.planet_slice(selected_index)
+        self.system_plot.animate_orbits(self.catalog.semi_major_axis[planets],
+                                        self.catalog.eccentricity.value[planets],
+                                        self.catalog.orbital_period.value[planets])
+
+    @traced()
+    def show_population(self):
+        # Density map of the whole catalog in its own window; the toolbar's
+        # pan and zoom rebin only the visible range on the next draw
+        window = tk.Toplevel(self.root)
+        window.title("Exoplanet Population")
+        plot = PopulationPlot(self.catalog.index.population, Figure(figsize=(9, 8)))
+        canvas = FigureCanvasTkAgg(plot.figure, master=window)
+        NavigationToolbar2Tk(canvas, window).pack(side="bottom", fill="x")
+        canvas.get_tk_widget().pack(side="top", fill="both", expand=True)
+        canvas.draw()
+
+    def select_hz_model(self, event=None):
+        self.system_plot.hz_model = self.catalog.derived.hz_model = self.hz_model_combobox.get()
+        self._plotted_index = None
+        if self.selected_system() != -1:
+            self.select_planetary_system()
+
+    @traced()
+    def select_exoplanet(self, selected_planet_index):
+        # `selected_planet_index` is the planet's position within the shown system
+        self.exoplanet_data_label.config(text=exoplanet_details(self.catalog, self._shown_system,
+                                                                selected_planet_index, self.system_plot.hz_model))
+
+    @traced()
+    def plot_custom_data(self):
+        try:
+            luminosity = float(self.luminosity_entry.get())
+            exoplanets = list(map(float, self.exoplanets_entry.get().split(',')))
+            planet_labels = self.planet_labels_entry.get().split(',')
+            temperature = float(self.temperature_entry.get()) if self.temperature_entry.get().strip() else None
+            if len(exoplanets) != len(planet_labels):
+                messagebox.showerror("Error", "Number of exoplanets and labels must match.")
+                return
+            if temperature is None and self.system_plot.hz_model != SIMPLE_MODEL:
+                messagebox.showerror("Error", "Please enter the stellar temperature for this HZ model.")
+                return
+            self.render_system(luminosity, exoplanets, planet_labels, temperature)
+            self._plotted_index = None
+        except ValueError:
+            messagebox.showerror("Error", "Invalid input. Please enter valid numbers.")
+
+    @traced()
+    def import_custom_systems(self):
+        path = filedialog.askopenfilename(title="Import Custom Systems",
+                                          filetypes=[("Systems", "*.csv *.jsonl *.ndjson"), ("All files", "*")])
+        if not path:
+            return
+        try:
+            report = import_systems(path, existing_names=self.catalog.names)
+        except (OSError, ValueError) as error:
+            messagebox.showerror("Error", f"Could not import {path}: {error}")
+            return
+        # Imported systems are appended, so existing indices stay valid
+        if report.imported:
+            self.catalog = concatenate_catalogs([self.catalog, report.catalog])
+            self.planetary_systems = self.catalog.systems
+            self.catalog.derived.hz_model = self.system_plot.hz_model
+            show_systems(self.system_table, self.catalog)
+            self.filter_systems()
+        self.import_report_label.config(text=format_report(report, path))
+
+
+def main(catalog_path=None):
+    root = tk.Tk()
+    HabitableZoneApp(root, load_catalog(catalog_path))
+    root.mainloop()
@@ -0,0 +1,102 @@
+from collections import namedtuple
+
+import numpy as np
+
+# Solar effective temperature (K), for Stefan-Boltzmann luminosity estimates
+SUN_TEMPERATURE = 5772
+
+HZ_INNER_FACTOR = 0.95
+HZ_OUTER_FACTOR = 1.37
+
+# HZ models accepted by hz_bounds / classify_planets
+SIMPLE_MODEL = "simple"  # 0.95 and 1.37 x sqrt(L)
+KOPPARAPU_MODEL = "kopparapu"  # temperature-dependent limits of Kopparapu et al. (2014)
+HZ_MODELS = (SIMPLE_MODEL, KOPPARAPU_MODEL)
+
+# Kopparapu et al. (2014) limits, 1 Earth-mass planet: S_eff = S_eff_sun + a T + b T^2 + c T^3 + d T^4
+# with T = T_eff - 5780 K, and the limit distance is sqrt(L / S_eff) AU.
+HZ_LIMITS = ("Recent Venus", "Runaway greenhouse", "Maximum greenhouse", "Early Mars")
+RECENT_VENUS, RUNAWAY_GREENHOUSE, MAXIMUM_GREENHOUSE, EARLY_MARS = range(len(HZ_LIMITS))
+KOPPARAPU_COEFFICIENTS = np.array([
+    # S_eff_sun, a, b, c, d
+    [1.776, 2.136e-4, 2.533e-8, -1.332e-11, -3.097e-15],
+    [1.107, 1.332e-4, 1.580e-8, -8.308e-12, -1.931e-15],
+    [0.356, 6.171e-5, 1.698e-9, -3.198e-12, -5.575e-16],
+    [0.320, 5.547e-5, 1.526e-9, -2.874e-12, -5.011e-16],
+])
+# The fits are only valid over this effective-temperature range; stars outside it are clamped.
+KOPPARAPU_TEMPERATURE_RANGE = (2600.0, 7200.0)
+KOPPARAPU_REFERENCE_TEMPERATURE = 5780.0
+
+# Zone codes returned by classify_planets
+INSIDE_HZ = 0
+INNER = 1  # closer than the inner edge (too hot)
+OUTER = 2  # beyond the outer edge (too cold)
+ZONE_NAMES = ("Inside HZ", "Inner", "Outer")
+
+HZClassification = namedtuple("HZClassification", ["inner", "outer", "zone"])
+SeffTable = namedtuple("SeffTable", ["start", "step", "seff"])
+
+
+def effective_flux(temperature, table=None):
+    # S_eff for every limit: an (N_stars x N_limits) array, from the polynomials
+    # or, when `table` is given, by linear interpolation in it.
+    low, high = KOPPARAPU_TEMPERATURE_RANGE
+    temperature = np.clip(np.asarray(temperature, dtype=np.float64), low, high)
+    if table is not None:
+        position = (temperature - table.start) / table.step
+        below = np.clip(position.astype(np.int64), 0, len(table.seff) - 2)
+        weight = (position - below)[..., np.newaxis]
+        return table.seff[below] * (1 - weight) + table.seff[below + 1] * weight
+
+    t = (temperature - KOPPARAPU_REFERENCE_TEMPERATURE)[..., np.newaxis]
+    seff_sun, a, b, c, d = KOPPARAPU_COEFFICIENTS.T
+    return seff_sun + t * (a + t * (b + t * (c + t * d)))
+
+
+def effective_flux_table(step=1.0):
+    # Precomputed S_eff on a uniform temperature grid for effective_flux(table=...)
+    low, high = KOPPARAPU_TEMPERATURE_RANGE
+    temperatures = np.arange(low, high + step, step)
+    return SeffTable(low, step, effective_flux(temperatures))
+
+
+def hz_limits(luminosity, temperature, table=None):
+    # Distances in AU of all four limits, one row per star
+    luminosity = np.asarray(luminosity, dtype=np.float64)
+    return np.sqrt(luminosity[..., np.newaxis] / effective_flux(temperature, table))
+
+
+def hz_bounds(luminosity, temperature=None, model=SIMPLE_MODEL, table=None):
+    # Inner and outer HZ edges.  The Kopparapu model uses the conservative
+    # runaway / maximum greenhouse limits and needs `temperature`.
+    luminosity = np.asarray(luminosity, dtype=np.float64)
+    if model == SIMPLE_MODEL:
+        root = np.sqrt(luminosity)
+        return HZ_INNER_FACTOR * root, HZ_OUTER_FACTOR * root
+    if model == KOPPARAPU_MODEL:
+        if temperature is None:
+            raise ValueError("The Kopparapu HZ model needs the stellar temperature.")
+        limits = hz_limits(luminosity, temperature, table)
+        return limits[..., RUNAWAY_GREENHOUSE], limits[..., MAXIMUM_GREENHOUSE]
+    raise ValueError(f"Unknown HZ model {model!r}; expected one of {', '.join(HZ_MODELS)}.")
+
+
+def classify_planets(luminosity, semi_major_axes, planet_counts=None, temperature=None,
+                     model=SIMPLE_MODEL, table=None):
+    # `luminosity` (and `temperature`) are either one value per planet, or one
+    # value per star when `planet_counts` gives how many of the flattened
+    # planets belong to each star.  Bounds are computed per star before
+    # broadcasting to planets.
+    inner, outer = hz_bounds(luminosity, temperature, model, table)
+    semi_major_axes = np.asarray(semi_major_axes, dtype=np.float64)
+    if planet_counts is not None:
+        inner = np.repeat(inner, planet_counts)
+        outer = np.repeat(outer, planet_counts)
+    if inner.shape != semi_major_axes.shape:
+        raise ValueError("Luminosity and semi-major axis arrays must have matching lengths.")
+
+    zone = np.full(semi_major_axes.shape, INSIDE_HZ, dtype=np.int8)
+    zone[semi_major_axes < inner] = INNER
+    zone[semi_major_axes > outer] = OUTER
+    return HZClassification(inner, outer, zone)
@@ -0,0 +1,379 @@
+import argparse
+import asyncio
+import json
+import math
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from urllib.parse import parse_qs, unquote, urlsplit
+
+import numpy as np
+
+from catalog_loader import load_catalog
+from habitable_zone import HZ_MODELS, KOPPARAPU_MODEL, SIMPLE_MODEL, ZONE_NAMES, classify_planets, hz_bounds
+from orbits import time_in_hz_fraction
+from population import DEFAULT_BINS
+from render_cache import RenderCache, render_key
+from tracing import span
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+DEFAULT_DPI = 100
+MAX_DPI = 300
+FIGSIZE = (8, 8)
+# Renders allowed to wait for a worker per worker process; beyond that the
+# service answers 503 instead of queueing without bound
+QUEUE_PER_WORKER = 8
+KEEP_ALIVE_TIMEOUT = 15.0
+MAX_HEADER_BYTES = 16 * 1024
+MAX_BODY_BYTES = 16 * 1024 * 1024
+DEFAULT_SEARCH_LIMIT = 50
+MAX_POPULATION_BINS = 1000
+
+REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed", 413: "Payload Too Large",
+           500: "Internal Server Error", 503: "Service Unavailable"}
+
+# Per-process state of the render workers, keyed by (hz_model, dpi)
+_renderers = {}
+
+
+class HTTPError(Exception):
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+def _render_png(luminosity, exoplanets, planet_labels, temperature, hz_model, dpi):
+    # Runs in a worker process.  The service keeps the shared cache, so the
+    # worker's CachedRenderer has its memory tier disabled.
+    renderer = _renderers.get((hz_model, dpi))
+    if renderer is None:
+        import matplotlib
+
+        matplotlib.use("Agg")
+        from render_cache import CachedRenderer
+
+        renderer = _renderers[hz_model, dpi] = CachedRenderer(RenderCache(max_bytes=0), FIGSIZE, dpi, hz_model)
+    return renderer.render(luminosity, exoplanets, planet_labels, "png", temperature)
+
+
+def _finite(values):
+    # JSON has no NaN: missing values become null
+    if isinstance(values, np.ndarray):
+        values = values.tolist()
+    if isinstance(values, (list, tuple)):
+        return [_finite(value) for value in values]
+    if isinstance(values, (float, np.floating)):
+        return float(values) if math.isfinite(values) else None
+    if isinstance(values, dict):
+        return {key: _finite(value) for key, value in values.items()}
+    if isinstance(values, np.integer):
+        return int(values)
+    return values
+
+
+def _query_value(query, name, default=None, convert=str):
+    values = query.get(name)
+    if not values:
+        if default is None:
+            raise HTTPError(400, f"Missing query parameter {name!r}.")
+        return default
+    try:
+        return convert(values[0])
+    except ValueError:
+        raise HTTPError(400, f"Invalid value for {name!r}: {values[0]!r}.") from None
+
+
+def _model(query):
+    model = _query_value(query, "model", SIMPLE_MODEL)
+    if model not in HZ_MODELS:
+        raise HTTPError(400, f"Unknown HZ model {model!r}; expected one of {', '.join(HZ_MODELS)}.")
+    return model
+
+
+def _check_star(luminosity, temperature, model):
+    # Inputs hz_bounds would silently turn into NaN edges
+    if not (math.isfinite(luminosity) and luminosity > 0):
+        raise HTTPError(400, "luminosity must be a positive number.")
+    if model == KOPPARAPU_MODEL and not (temperature is not None and math.isfinite(temperature)):
+        raise HTTPError(400, f"The {KOPPARAPU_MODEL} model needs a finite stellar temperature.")
+
+
+class HZService:
+    # Serves the catalog, HZ bounds and classification as JSON and system plots
+    # as PNG over HTTP/1.1 with keep-alive.  Renders run on a bounded process
+    # pool; identical renders in flight at the same time share one job, and
+    # finished images are kept in a RenderCache.
+
+    def __init__(self, catalog, workers=None, cache=None):
+        self.catalog = catalog
+        self.workers = workers or os.cpu_count() or 1
+        self.cache = cache if cache is not None else RenderCache()
+        self.max_pending = self.workers * QUEUE_PER_WORKER
+        self._pool = None
+        self._in_flight = {}
+        self.stats = {"requests": 0, "renders": 0, "coalesced": 0, "rejected": 0, "connections": 0}
+        self.routes = {
+            ("GET", "health"): self.health,
+            ("GET", "stats"): self.get_stats,
+            ("GET", "hz"): self.hz,
+            ("GET", "systems"): self.systems,
+            ("GET", "population"): self.population,
+            ("POST", "plot.png"): self.custom_plot,
+        }
+
+    async def start(self, host=DEFAULT_HOST, port=DEFAULT_PORT):
+        self._pool = ProcessPoolExecutor(self.workers)
+        return await asyncio.start_server(self.handle_connection, host, port, limit=MAX_HEADER_BYTES)
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
+
+    async def handle_connection(self, reader, writer):
+        self.stats["connections"] += 1
+        try:
+            while True:
+                try:
+                    head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), KEEP_ALIVE_TIMEOUT)
+                except (asyncio.TimeoutError, asyncio.IncompleteReadError, asyncio.LimitOverrunError,
+                        ConnectionError, asyncio.CancelledError):
+                    # Idle timeout, client gone, or server shutting down
+                    return
+                keep_alive = await self._handle_request(head, reader, writer)
+                await writer.drain()
+                if not keep_alive:
+                    return
+        finally:
+            writer.close()
+
+    async def _handle_request(self, head, reader, writer):
+        self.stats["requests"] += 1
+        lines = head.decode("latin-1").split("\r\n")
+        try:
+            method, target, version = lines[0].split(" ", 2)
+        except ValueError:
+            self._respond(writer, 400, *self._json({"error": "Malformed request line."}), False)
+            return False
+        headers = {}
+        for line in lines[1:]:
+            name, _, value = line.partition(":")
+            if name:
+                headers[name.strip().lower()] = value.strip()
+        connection = headers.get("connection", "").lower()
+        keep_alive = connection != "close" if version == "HTTP/1.1" else connection == "keep-alive"
+
+        try:
+            length = int(headers.get("content-length", 0))
+            if length > MAX_BODY_BYTES:
+                raise HTTPError(413, "Request body too large.")
+            body = await reader.readexactly(length) if length else b""
+            with span("HZService.request", method=method, target=target):
+                status, content_type, payload = await self.dispatch(method, target, body)
+        except HTTPError as error:
+            status, (content_type, payload) = error.status, self._json({"error": str(error)})
+        except asyncio.IncompleteReadError:
+            return False
+        except Exception as error:  # report instead of dropping the connection
+            status, (content_type, payload) = 500, self._json({"error": f"{type(error).__name__}: {error}"})
+        self._respond(writer, status, content_type, payload, keep_alive)
+        return keep_alive
+
+    @staticmethod
+    def _respond(writer, status, content_type, payload, keep_alive):
+        head = (f"HTTP/1.1 {status} {REASONS.get(status, '')}\r\n"
+                f"Content-Type: {content_type}\r\n"
+                f"Content-Length: {len(payload)}\r\n"
+                f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+        writer.write(head.encode("latin-1") + payload)
+
+    @staticmethod
+    def _json(value):
+        return "application/json", json.dumps(value, allow_nan=False).encode()
+
+    async def dispatch(self, method, target, body):
+        url = urlsplit(target)
+        query = parse_qs(url.query)
+        parts = [unquote(part) for part in url.path.strip("/").split("/") if part]
+        if not parts:
+            raise HTTPError(404, "Unknown route.")
+
+        if parts[0] == "systems" and len(parts) > 1:
+            if method != "GET":
+                raise HTTPError(405, "Method not allowed.")
+            index = self.system_index(parts[1])
+            if len(parts) == 2:
+                return (200, *self._json(_finite(self.catalog.system(index))))
+            if len(parts) == 3 and parts[2] == "classification":
+                return (200, *self._json(self.classification(index, _model(query))))
+            if len(parts) == 3 and parts[2] == "plot.png":
+                return 200, "image/png", await self.system_plot(index, query)
+            raise HTTPError(404, "Unknown route.")
+
+        handler = self.routes.get((method, "/".join(parts)))
+        if handler is None:
+            if any(route == "/".join(parts) for _, route in self.routes):
+                raise HTTPError(405, "Method not allowed.")
+            raise HTTPError(404, "Unknown route.")
+        result = handler(query, body)
+        if asyncio.iscoroutine(result):
+            result = await result
+        if isinstance(result, bytes):
+            return 200, "image/png", result
+        return (200, *self._json(result))
+
+    def system_index(self, key):
+        # A catalog index or a system name
+        if key.isdigit():
+            index = int(key)
+            if index >= len(self.catalog):
+                raise HTTPError(404, f"No system with index {index}.")
+            return index
+        try:
+            return self.catalog.index.system_index(key)
+        except KeyError:
+            raise HTTPError(404, f"No system named {key!r}.") from None
+
+    def health(self, query, body):
+        return {"status": "ok", "systems": len(self.catalog), "planets": self.catalog.planet_count}
+
+    def get_stats(self, query, body):
+        return {**self.stats, "in_flight": len(self._in_flight), "cache": self.cache.stats._asdict()}
+
+    def hz(self, query, body):
+        luminosity = _query_value(query, "luminosity", convert=float)
+        temperature = _query_value(query, "temperature", math.nan, float)
+        model = _model(query)
+        _check_star(luminosity, temperature, model)
+        inner, outer = hz_bounds(luminosity, temperature, model)
+        return _finite({"inner": inner, "outer": outer})
+
+    def systems(self, query, body):
+        limit = _query_value(query, "limit", DEFAULT_SEARCH_LIMIT, int)
+        matches = self.catalog.index.search_names(_query_value(query, "q", ""), limit)
+        counts = self.catalog.planet_counts
+        return [{"index": int(i), "name": self.catalog.names[i], "planets": int(counts[i])} for i in matches]
+
+    def population(self, query, body):
+        # Planet counts on a log-spaced grid of semi-major axis (AU) against
+        # host luminosity (solar), binned over the requested range only;
+        # counts are indexed [luminosity bin][semi-major axis bin]
+        index = self.catalog.index.population
+        bounds = list(index.extent)  # whole population by default, in log10 units
+        for position, name in enumerate(("a_min", "a_max", "l_min", "l_max")):
+            if name in query:
+                value = _query_value(query, name, convert=float)
+                if not value > 0:
+                    raise HTTPError(400, f"{name} must be positive.")
+                bounds[position] = math.log10(value)
+        bins = _query_value(query, "bins", DEFAULT_BINS, int)
+        if not 1 <= bins <= MAX_POPULATION_BINS:
+            raise HTTPError(400, f"bins must be between 1 and {MAX_POPULATION_BINS}.")
+        density = index.density(bounds[:2], bounds[2:], bins)
+        return {"planets": density.planets, "semi_major_axis_edges": (10 ** density.x_edges).tolist(),
+                "luminosity_edges": (10 ** density.y_edges).tolist(), "counts": density.counts.tolist()}
+
+    def classification(self, index, model):
+        catalog = self.catalog
+        planets = catalog.planet_slice(index)
+        semi_major_axis = catalog.semi_major_axis[planets]
+        bounds = classify_planets(catalog.luminosity[index:index + 1], semi_major_axis, [len(semi_major_axis)],
+                                  catalog.temperature[index:index + 1], model)
+        fraction = time_in_hz_fraction(semi_major_axis, catalog.eccentricity.value[planets], bounds.inner[0],
+                                       bounds.outer[0])
+        labels = catalog.planet_columns["planet_labels"][planets]
+        return _finite({
+            "name": catalog.names[index], "model": model, "inner": bounds.inner[0], "outer": bounds.outer[0],
+            "planets": [{"label": label, "semi_major_axis": a, "zone": ZONE_NAMES[zone], "time_in_hz": time}
+                        for label, a, zone, time in zip(labels, semi_major_axis.tolist(), bounds.zone.tolist(),
+                                                        fraction.tolist())],
+        })
+
+    async def system_plot(self, index, query):
+        planets = self.catalog.planet_slice(index)
+        return await self.render(self.catalog.luminosity[index], self.catalog.semi_major_axis[planets],
+                                 self.catalog.planet_columns["planet_labels"][planets].tolist(),
+                                 self.catalog.temperature[index], query)
+
+    async def custom_plot(self, query, body):
+        try:
+            request = json.loads(body)
+            luminosity = float(request["luminosity"])
+            exoplanets = np.asarray(request["exoplanets"], dtype=np.float64)
+            planet_labels = [str(label) for label in request.get("planet_labels", [])]
+            temperature = request.get("temperature")
+            temperature = math.nan if temperature is None else float(temperature)
+        except (ValueError, TypeError, KeyError) as error:
+            raise HTTPError(400, f"Invalid plot request: {error}") from None
+        if exoplanets.ndim != 1 or len(planet_labels) not in (0, len(exoplanets)):
+            raise HTTPError(400, "exoplanets must be a list matching planet_labels.")
+        return await self.render(luminosity, exoplanets, planet_labels or [""] * len(exoplanets), temperature, query)
+
+    async def render(self, luminosity, exoplanets, planet_labels, temperature, query):
+        model = _model(query)
+        dpi = _query_value(query, "dpi", DEFAULT_DPI, int)
+        if not 10 <= dpi <= MAX_DPI:
+            raise HTTPError(400, f"dpi must be between 10 and {MAX_DPI}.")
+        # Checked before the cache and the pool, so bad input never reaches a worker
+        luminosity, temperature = float(luminosity), float(temperature)
+        _check_star(luminosity, temperature, model)
+        exoplanets = np.asarray(exoplanets, dtype=np.float64)
+        if not np.all(np.isfinite(exoplanets) & (exoplanets > 0)):
+            raise HTTPError(400, "Every semi-major axis must be a positive number.")
+        temperature = None if math.isnan(temperature) else temperature
+        settings = {"figsize": FIGSIZE, "dpi": dpi, "hz_model": model, "format": "png"}
+        key = render_key(luminosity, exoplanets, planet_labels, settings, temperature)
+        data = self.cache.get(key)
+        if data is not None:
+            return data
+
+        # Identical renders already running are awaited rather than repeated
+        future = self._in_flight.get(key)
+        if future is not None:
+            self.stats["coalesced"] += 1
+            return await asyncio.shield(future)
+        if len(self._in_flight) >= self.max_pending:
+            self.stats["rejected"] += 1
+            raise HTTPError(503, "Render queue is full; retry later.")
+
+        loop = asyncio.get_running_loop()
+        future = self._in_flight[key] = loop.run_in_executor(
+            self._pool, _render_png, luminosity, exoplanets, planet_labels, temperature, model, dpi)
+        try:
+            data = await asyncio.shield(future)
+        finally:
+            self._in_flight.pop(key, None)
+        self.stats["renders"] += 1
+        self.cache.put(key, data)
+        return data
+
+
+async def serve(host=DEFAULT_HOST, port=DEFAULT_PORT, catalog_path=None, workers=None):
+    service = HZService(load_catalog(catalog_path), workers)
+    server = await service.start(host, port)
+    print(f"Serving {len(service.catalog)} systems on http://{host}:{port} with {service.workers} render workers")
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        service.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Local HTTP/JSON service for HZ queries and system plots.")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--catalog", help="archive CSV export to load instead of the bundled systems")
+    parser.add_argument("--workers", type=int, help="render worker processes (default: CPU count)")
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(serve(args.host, args.port, args.catalog, args.workers))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,77 @@
+import re
+from collections import namedtuple
+
+import numpy as np
+
+JUPITER_MASS_IN_EARTH = 317.8
+
+# Bound codes returned by parse_column
+EXACT = 0
+LOWER_BOUND = 1  # "≥8.23", ">11": the true value is at least `value`
+UPPER_BOUND = 2  # "<0.1", "≤0.16": the true value is at most `value`
+RANGE = 3  # "1—100": only `low` and `high` are known
+BOUND_NAMES = ("Exact", "Lower bound", "Upper bound", "Range")
+
+ParsedColumn = namedtuple("ParsedColumn", ["value", "low", "high", "error", "bound", "missing"])
+
+_NUMBER = r"(\d+(?:\.\d*)?|\.\d+)"
+_QUANTITY = re.compile(
+    r"^(?P<prefix>[<>≤≥]=?)?\s*" + _NUMBER +
+    r"(?:\s*(?:±|\+/-)\s*" + _NUMBER + r"|\s*[—–-]\s*" + _NUMBER + r")?\s*(?P<unit>.*)$"
+)
+_UNIT_SCALES = {
+    "": 1.0,
+    "m🜨": 1.0,
+    "me": 1.0,
+    "mj": JUPITER_MASS_IN_EARTH,
+    "mass of jupiter": JUPITER_MASS_IN_EARTH,
+    "days": 1.0,
+    "d": 1.0,
+}
+_PREFIX_BOUNDS = {">": LOWER_BOUND, ">=": LOWER_BOUND, "≥": LOWER_BOUND,
+                  "<": UPPER_BOUND, "<=": UPPER_BOUND, "≤": UPPER_BOUND}
+_MISSING = (np.nan, np.nan, np.nan, np.nan, EXACT, True)
+
+
+def parse_quantity(text):
+    # Returns (value, low, high, error, bound, missing) for one free-text field,
+    # with masses in Earth masses and periods in days.  Unknown units and
+    # placeholders such as "-" or "Unsure" are reported as missing.
+    match = _QUANTITY.match(str(text).strip().replace(",", ""))
+    if match is None:
+        return _MISSING
+    scale = _UNIT_SCALES.get(" ".join(match["unit"].lower().split()))
+    if scale is None:
+        return _MISSING
+
+    number, error, upper = (float(group) * scale if group is not None else None
+                            for group in match.groups()[1:4])
+    if upper is not None:
+        return (number + upper) / 2, number, upper, np.nan, RANGE, False
+    if error is not None:
+        return number, number - error, number + error, error, EXACT, False
+    bound = _PREFIX_BOUNDS.get(match["prefix"], EXACT)
+    low = number if bound != UPPER_BOUND else -np.inf
+    high = number if bound != LOWER_BOUND else np.inf
+    return number, low, high, np.nan, bound, False
+
+
+def parse_column(texts):
+    # Parses each distinct string once and scatters the results back, so
+    # repeated values ("-", "0.05", ...) cost one parse for the whole column.
+    texts = np.asarray(texts, dtype=object)
+    unique, inverse = np.unique(texts.astype(str), return_inverse=True)
+    parsed = [parse_quantity(text) for text in unique]
+    if parsed:
+        values, lows, highs, errors, bounds, missing = zip(*parsed)
+    else:
+        values = lows = highs = errors = bounds = missing = ()
+    inverse = inverse.reshape(texts.shape)
+    return ParsedColumn(
+        np.asarray(values, dtype=np.float64)[inverse],
+        np.asarray(lows, dtype=np.float64)[inverse],
+        np.asarray(highs, dtype=np.float64)[inverse],
+        np.asarray(errors, dtype=np.float64)[inverse],
+        np.asarray(bounds, dtype=np.int8)[inverse],
+        np.asarray(missing, dtype=bool)[inverse],
+    )
@@ -0,0 +1,153 @@
+import argparse
+import sys
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from habitable_zone import HZ_MODELS, SIMPLE_MODEL, hz_bounds
+from measurements import EXACT, LOWER_BOUND, RANGE, UPPER_BOUND
+from orbits import MAX_ECCENTRICITY, time_in_hz_fraction
+
+# The catalog carries no uncertainty for these, so they get a relative
+# (log-normal) scatter unless the caller passes per-planet values.
+DEFAULT_LUMINOSITY_ERROR = 0.1
+DEFAULT_SEMI_MAJOR_AXIS_ERROR = 0.03
+DEFAULT_DRAWS = 10_000
+# Planets are simulated in fixed blocks with their own seeds, so results do
+# not depend on the number of worker processes.
+PLANETS_PER_BLOCK = 256
+# Upper bound on planet x draw samples held in memory at once per block
+MAX_BLOCK_ELEMENTS = 1 << 21
+
+MonteCarloResult = namedtuple("MonteCarloResult", ["probability", "mean_fraction"])
+PlanetInputs = namedtuple("PlanetInputs", [
+    "luminosity", "luminosity_error", "hz_inner", "hz_outer", "semi_major_axis", "semi_major_axis_error",
+    "eccentricity_mean", "eccentricity_sigma", "eccentricity_low", "eccentricity_high", "eccentricity_uniform",
+])
+
+
+def planet_inputs(catalog, model=SIMPLE_MODEL, luminosity_error=DEFAULT_LUMINOSITY_ERROR,
+                  semi_major_axis_error=DEFAULT_SEMI_MAJOR_AXIS_ERROR):
+    # Per-planet sampling parameters.  HZ edges are stored for L = 1: every
+    # model scales as sqrt(L), so a drawn luminosity only rescales them.
+    counts = catalog.planet_counts
+    luminosity = np.repeat(catalog.luminosity, counts)
+    inner, outer = hz_bounds(np.ones(len(catalog)), catalog.temperature, model)
+
+    # Eccentricity: normal around "x ± s", uniform over bounds and ranges,
+    # fixed for plain values, circular when missing
+    eccentricity = catalog.eccentricity
+    uniform = np.isin(eccentricity.bound, (LOWER_BOUND, UPPER_BOUND, RANGE)) & ~eccentricity.missing
+    low = np.where(eccentricity.bound == UPPER_BOUND, 0.0, eccentricity.low)
+    high = np.where(eccentricity.bound == LOWER_BOUND, 1.0, eccentricity.high)
+    sigma = np.where((eccentricity.bound == EXACT) & ~np.isnan(eccentricity.error), eccentricity.error, 0.0)
+    return PlanetInputs(
+        luminosity,
+        np.broadcast_to(np.asarray(luminosity_error, dtype=np.float64), luminosity.shape),
+        np.repeat(inner, counts),
+        np.repeat(outer, counts),
+        catalog.semi_major_axis,
+        np.broadcast_to(np.asarray(semi_major_axis_error, dtype=np.float64), luminosity.shape),
+        np.nan_to_num(eccentricity.value),
+        sigma,
+        np.nan_to_num(low),
+        np.nan_to_num(high),
+        uniform,
+    )
+
+
+def simulate_block(inputs, draws, seed, min_fraction=0.5):
+    # Draws `draws` samples for every planet in `inputs` (a PlanetInputs slice).
+    # Returns the share of draws spending at least `min_fraction` of the orbit
+    # in the HZ, and the mean time-in-HZ fraction.
+    rng = np.random.default_rng(seed)
+    planets = len(inputs.luminosity)
+    hits = np.zeros(planets)
+    total_fraction = np.zeros(planets)
+    per_pass = max(1, MAX_BLOCK_ELEMENTS // max(planets, 1))
+    column = np.s_[:, np.newaxis]
+    for start in range(0, draws, per_pass):
+        shape = (planets, min(per_pass, draws - start))
+        scale = np.sqrt(inputs.luminosity[column] * np.exp(inputs.luminosity_error[column] * rng.standard_normal(shape)))
+        semi_major_axis = inputs.semi_major_axis[column] * np.exp(
+            inputs.semi_major_axis_error[column] * rng.standard_normal(shape))
+        normal = inputs.eccentricity_mean[column] + inputs.eccentricity_sigma[column] * rng.standard_normal(shape)
+        low, high = inputs.eccentricity_low[column], inputs.eccentricity_high[column]
+        uniform = low + (high - low) * rng.random(shape)
+        eccentricity = np.clip(np.where(inputs.eccentricity_uniform[column], uniform, normal), 0, MAX_ECCENTRICITY)
+
+        fraction = time_in_hz_fraction(semi_major_axis, eccentricity, inputs.hz_inner[column] * scale,
+                                       inputs.hz_outer[column] * scale).reshape(shape)
+        hits += (fraction >= min_fraction).sum(axis=1)
+        total_fraction += fraction.sum(axis=1)
+    return hits / draws, total_fraction / draws
+
+
+def _simulate(args):
+    return simulate_block(*args)
+
+
+def habitability_probability(catalog, draws=DEFAULT_DRAWS, seed=0, model=SIMPLE_MODEL, min_fraction=0.5,
+                             luminosity_error=DEFAULT_LUMINOSITY_ERROR,
+                             semi_major_axis_error=DEFAULT_SEMI_MAJOR_AXIS_ERROR, workers=None):
+    # Monte Carlo probability that each planet is habitable given the reported
+    # uncertainties.  Seeded per planet block, so a given seed reproduces the
+    # same result whether it runs serially or on `workers` processes.
+    inputs = planet_inputs(catalog, model, luminosity_error, semi_major_axis_error)
+    planets = len(inputs.luminosity)
+    blocks = [slice(start, start + PLANETS_PER_BLOCK) for start in range(0, planets, PLANETS_PER_BLOCK)]
+    seeds = np.random.SeedSequence(seed).spawn(len(blocks))
+    jobs = [(PlanetInputs(*(values[block] for values in inputs)), draws, block_seed, min_fraction)
+            for block, block_seed in zip(blocks, seeds)]
+
+    if workers is None or workers <= 1:
+        results = map(_simulate, jobs)
+    else:
+        pool = ProcessPoolExecutor(workers)
+        results = pool.map(_simulate, jobs)
+
+    probability = np.empty(planets)
+    mean_fraction = np.empty(planets)
+    try:
+        for block, (block_probability, block_fraction) in zip(blocks, results):
+            probability[block] = block_probability
+            mean_fraction[block] = block_fraction
+    finally:
+        if workers is not None and workers > 1:
+            pool.shutdown()
+    invalid = np.isnan(inputs.semi_major_axis) | np.isnan(inputs.luminosity)
+    probability[invalid] = np.nan
+    mean_fraction[invalid] = np.nan
+    return MonteCarloResult(probability, mean_fraction)
+
+
+def main(argv=None):
+    from catalog_loader import load_catalog
+
+    parser = argparse.ArgumentParser(description="Monte Carlo HZ probability for every planet in the catalog.")
+    parser.add_argument("--catalog", help="archive CSV export to load instead of the bundled systems")
+    parser.add_argument("--draws", type=int, default=DEFAULT_DRAWS)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--hz-model", choices=HZ_MODELS, default=SIMPLE_MODEL)
+    parser.add_argument("--min-fraction", type=float, default=0.5,
+                        help="share of the orbit a draw must spend in the HZ to count as habitable")
+    parser.add_argument("--workers", type=int, help="worker processes (default: run serially)")
+    parser.add_argument("--threshold", type=float, default=0.0, help="only list planets above this probability")
+    args = parser.parse_args(argv)
+
+    catalog = load_catalog(args.catalog)
+    start = time.perf_counter()
+    result = habitability_probability(catalog, args.draws, args.seed, args.hz_model, args.min_fraction,
+                                      workers=args.workers)
+    elapsed = time.perf_counter() - start
+    labels = catalog.planet_columns["planet_labels"]
+    for planet in np.flatnonzero(result.probability > args.threshold):
+        print(f"{result.probability[planet]:7.1%}  {result.mean_fraction[planet]:7.1%}  {labels[int(planet)]}")
+    print(f"{args.draws} draws x {catalog.planet_count} planets in {elapsed:.2f} s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,87 @@
+import bisect
+import re
+from collections import defaultdict
+
+import numpy as np
+
+NGRAM = 3
+DEFAULT_LIMIT = 200
+
+
+def normalize(text):
+    return " ".join(str(text).casefold().split())
+
+
+def _ngrams(text):
+    return {text[i:i + NGRAM] for i in range(len(text) - NGRAM + 1)}
+
+
+class NameSearchIndex:
+    # Incremental name search for the system selector.  A sorted list answers
+    # prefix queries by bisection; a trigram -> positions index narrows
+    # substring queries to the names sharing the query's rarest trigram, which
+    # are then checked directly.  '*' in a query is a wildcard.
+
+    def __init__(self, names):
+        self.names = [normalize(name) for name in names]
+        self._order = sorted(range(len(self.names)), key=self.names.__getitem__)
+        self._sorted = [self.names[i] for i in self._order]
+        postings = defaultdict(list)
+        for position, name in enumerate(self.names):
+            for gram in _ngrams(name):
+                postings[gram].append(position)
+        self._postings = dict(postings)
+
+    @property
+    def sorted_positions(self):
+        # System indices in alphabetical order of their normalized names
+        return np.asarray(self._order, dtype=np.int64)
+
+    def search(self, query, limit=DEFAULT_LIMIT):
+        # System indices matching `query`: prefix matches first (alphabetical),
+        # then other substring matches in catalog order.
+        query = normalize(query)
+        if not query:
+            return np.arange(min(limit, len(self.names)))
+        if "*" in query:
+            return self._search_pattern(query, limit)
+
+        matches = self._prefix(query, limit)
+        if len(matches) < limit:
+            seen = set(matches)
+            for position in self._candidates(query):
+                if position not in seen and query in self.names[position]:
+                    matches.append(position)
+                    if len(matches) == limit:
+                        break
+        return np.asarray(matches, dtype=np.int64)
+
+    def _prefix(self, prefix, limit):
+        start = bisect.bisect_left(self._sorted, prefix)
+        stop = bisect.bisect_left(self._sorted, prefix + "\U0010ffff", start)
+        return self._order[start:min(stop, start + limit)]
+
+    def _candidates(self, fragment):
+        # Positions that may contain `fragment`; every name when it is too
+        # short to have a trigram.
+        grams = _ngrams(fragment)
+        if not grams:
+            return range(len(self.names))
+        return min((self._postings.get(gram, ()) for gram in grams), key=len)
+
+    def _search_pattern(self, pattern, limit):
+        fragments = [fragment for fragment in pattern.split("*") if fragment]
+        if not pattern.startswith("*") and fragments:
+            candidates = self._prefix(pattern.split("*")[0], len(self.names))
+        elif fragments:
+            candidates = min((self._candidates(fragment) for fragment in fragments), key=len)
+        else:
+            candidates = range(len(self.names))
+        regex = re.compile(".*".join(map(re.escape, pattern.split("*"))) + r"\Z")
+        matches = []
+        for position in candidates:
+            if regex.match(self.names[position]):
+                matches.append(position)
+                if len(matches) == limit:
+                    break
+        return np.asarray(matches, dtype=np.int64)
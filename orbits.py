@@ -0,0 +1,139 @@
+from collections import namedtuple
+
+import numpy as np
+
+KEPLER_TOLERANCE = 1e-12
+KEPLER_MAX_ITERATIONS = 50
+# Largest eccentricity treated as a bound orbit; catalog values are clipped to it
+MAX_ECCENTRICITY = 1 - 1e-9
+DEFAULT_CHUNK_SIZE = 1_000_000
+DAYS_PER_YEAR = 365.25
+
+KeplerSolution = namedtuple("KeplerSolution", ["anomaly", "converged"])
+
+
+def solve_kepler(mean_anomaly, eccentricity, tolerance=KEPLER_TOLERANCE, max_iterations=KEPLER_MAX_ITERATIONS,
+                 strict=False):
+    # Eccentric anomaly E with E - e sin E = M, by Newton iterations over whole
+    # arrays.  Only elements that have not converged yet are updated, so a few
+    # hard high-e orbits do not cost a full pass over every element.  Returns
+    # the anomalies and a mask of the elements that converged; the others hold
+    # their last iterate (NaN for NaN inputs).  With `strict`, any element that
+    # did not converge raises ArithmeticError instead.
+    mean_anomaly, eccentricity = np.broadcast_arrays(np.asarray(mean_anomaly, dtype=np.float64),
+                                                     np.asarray(eccentricity, dtype=np.float64))
+    shape = mean_anomaly.shape
+    mean_anomaly = np.remainder(mean_anomaly, 2 * np.pi).ravel()
+    eccentricity = eccentricity.ravel()
+    # Second-order series start; E = pi converges for every M when e is large
+    sin_mean = np.sin(mean_anomaly)
+    guess = mean_anomaly + eccentricity * sin_mean * (1 + eccentricity * np.cos(mean_anomaly))
+    anomaly = np.where(eccentricity < 0.8, guess, np.pi)
+    converged = np.zeros(anomaly.size, dtype=bool)
+
+    # The unconverged elements are kept as compacted copies and written back
+    # once done, so later iterations touch only the hard orbits.  NaN steps
+    # can never converge and are written back at once.
+    active = np.arange(anomaly.size)
+    E, e, M = anomaly, eccentricity, mean_anomaly
+    for _ in range(max_iterations):
+        step = (E - e * np.sin(E) - M) / (1 - e * np.cos(E))
+        E = E - step
+        small = np.abs(step) <= tolerance
+        done = small | np.isnan(step)
+        anomaly[active[done]] = E[done]
+        converged[active[small]] = True
+        pending = ~done
+        active, E, e, M = active[pending], E[pending], e[pending], M[pending]
+        if active.size == 0:
+            break
+    anomaly[active] = E
+    if strict and not converged.all():
+        raise ArithmeticError(f"Kepler's equation did not converge for {converged.size - converged.sum()} orbits.")
+    return KeplerSolution(anomaly.reshape(shape), converged.reshape(shape))
+
+
+def mean_anomaly_at_radius(radius, semi_major_axis, eccentricity):
+    # Mean anomaly in [0, pi] at which the orbit first reaches `radius` after
+    # periapsis; 0 inside periapsis and pi beyond apoapsis.
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cos_anomaly = (1 - radius / semi_major_axis) / eccentricity
+    circular = eccentricity == 0
+    cos_anomaly = np.where(circular, np.where(radius >= semi_major_axis, -1.0, 1.0), cos_anomaly)
+    anomaly = np.arccos(np.clip(cos_anomaly, -1.0, 1.0))
+    return anomaly - eccentricity * np.sin(anomaly)
+
+
+def time_in_hz_fraction(semi_major_axis, eccentricity, inner, outer, chunk_size=DEFAULT_CHUNK_SIZE):
+    # Fraction of each orbital period spent between `inner` and `outer`.
+    # Radius is monotonic between periapsis and apoapsis, so the time below a
+    # radius R is M(R) / pi, where M(R) is the mean anomaly at which r = R.
+    # Missing eccentricities are treated as circular orbits.  Work is done in
+    # chunks so temporaries stay bounded for millions of planets.
+    semi_major_axis, eccentricity, inner, outer = (
+        np.asarray(values, dtype=np.float64).ravel()
+        for values in np.broadcast_arrays(semi_major_axis, eccentricity, inner, outer)
+    )
+    fraction = np.empty(semi_major_axis.size)
+    for start in range(0, semi_major_axis.size, chunk_size):
+        chunk = slice(start, start + chunk_size)
+        a = semi_major_axis[chunk]
+        e = np.clip(np.nan_to_num(eccentricity[chunk]), 0, MAX_ECCENTRICITY)
+        below_outer = mean_anomaly_at_radius(outer[chunk], a, e)
+        below_inner = mean_anomaly_at_radius(inner[chunk], a, e)
+        fraction[chunk] = np.clip((below_outer - below_inner) / np.pi, 0, 1)
+    fraction[np.isnan(semi_major_axis) | np.isnan(inner) | np.isnan(outer)] = np.nan
+    return fraction
+
+
+def periapsis_angles(count):
+    # Orbits are drawn with evenly spaced periapsis directions, matching the
+    # static layout, since the catalog has no argument of periapsis.
+    return np.radians(np.arange(count) * (360 / max(count, 1)))
+
+
+def fill_missing_periods(period, semi_major_axis):
+    # Kepler's third law for a one-solar-mass star where the period is unknown
+    period = np.asarray(period, dtype=np.float64)
+    return np.where(np.isnan(period), DAYS_PER_YEAR * np.asarray(semi_major_axis, dtype=np.float64) ** 1.5, period)
+
+
+def orbital_positions(semi_major_axis, eccentricity, period, times, chunk_size=DEFAULT_CHUNK_SIZE,
+                      dtype=np.float32, converged=None, strict=False):
+    # (len(times), n_planets, 2) table of x/y positions in AU, every planet
+    # starting at periapsis at t = 0.  Kepler's equation is solved for the
+    # whole time x planet grid, a block of time rows at a time.  A
+    # (len(times), n_planets) bool array passed as `converged` receives the
+    # solver's convergence mask; `strict` raises on the first block that has
+    # an unconverged element (see solve_kepler).
+    a = np.asarray(semi_major_axis, dtype=np.float64)
+    e = np.clip(np.nan_to_num(np.asarray(eccentricity, dtype=np.float64)), 0, MAX_ECCENTRICITY)
+    mean_motion = 2 * np.pi / fill_missing_periods(period, a)
+    angle = periapsis_angles(len(a))
+    cos_angle, sin_angle = np.cos(angle), np.sin(angle)
+    semi_minor_axis = a * np.sqrt(1 - e ** 2)
+    times = np.asarray(times, dtype=np.float64)
+
+    positions = np.empty((len(times), len(a), 2), dtype=dtype)
+    rows = max(1, chunk_size // max(len(a), 1))
+    for start in range(0, len(times), rows):
+        block = slice(start, start + rows)
+        anomaly, block_converged = solve_kepler(times[block, np.newaxis] * mean_motion, e, strict=strict)
+        if converged is not None:
+            converged[block] = block_converged
+        x = a * (np.cos(anomaly) - e)
+        y = semi_minor_axis * np.sin(anomaly)
+        positions[block, :, 0] = x * cos_angle - y * sin_angle
+        positions[block, :, 1] = x * sin_angle + y * cos_angle
+    return positions
+
+
+def orbit_paths(semi_major_axis, eccentricity, points=129):
+    # (n_planets, points, 2) closed outline of every orbit, oriented like orbital_positions
+    a = np.asarray(semi_major_axis, dtype=np.float64)[:, np.newaxis]
+    e = np.clip(np.nan_to_num(np.asarray(eccentricity, dtype=np.float64)), 0, MAX_ECCENTRICITY)[:, np.newaxis]
+    anomaly = np.linspace(0, 2 * np.pi, points)
+    x = a * (np.cos(anomaly) - e)
+    y = a * np.sqrt(1 - e ** 2) * np.sin(anomaly)
+    angle = periapsis_angles(len(a))[:, np.newaxis]
+    return np.stack((x * np.cos(angle) - y * np.sin(angle), x * np.sin(angle) + y * np.cos(angle)), axis=-1)
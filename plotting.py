@@ -0,0 +1,205 @@
+import numpy as np
+
+from habitable_zone import SIMPLE_MODEL, hz_bounds
+from orbits import fill_missing_periods, orbit_paths, orbital_positions
+from tracing import span, traced
+
+PLOT_LIMIT_AU = 3
+# Systems with more planets than this get no static labels; the planet under
+# the cursor is labelled on hover instead.
+LABEL_LIMIT = 50
+# Marker area (points^2) for labelled systems, and for crowded ones, where
+# small non-antialiased markers keep a 10k-planet frame within a 60 fps budget
+MARKER_SIZE = 36
+CROWDED_MARKER_SIZE = 4
+ANIMATION_FPS = 60
+ANIMATION_FRAMES = 600
+
+
+class SystemPlot:
+    # One long-lived figure for the HZ view.  Switching systems only moves the
+    # existing circles, markers and labels; with `blit=True` those artists are
+    # animated and redrawn over a cached background instead of a full draw.
+
+    @traced("SystemPlot.setup")
+    def __init__(self, figure=None, blit=False, hz_model=SIMPLE_MODEL):
+        from matplotlib.collections import LineCollection
+        from matplotlib.figure import Figure
+        from matplotlib.patches import Circle
+
+        self.figure = figure if figure is not None else Figure(figsize=(8, 8))
+        self.blit = blit
+        self.hz_model = hz_model
+        self._background = None
+        self._animation = None  # canvas timer driving the orbit animation
+        self._positions = None
+        self._frame = 0
+
+        with span("add_subplot"):
+            ax = self.ax = self.figure.add_subplot()
+        ax.set_xlim(-PLOT_LIMIT_AU, PLOT_LIMIT_AU)
+        ax.set_ylim(-PLOT_LIMIT_AU, PLOT_LIMIT_AU)
+
+        self.outer_hz = Circle((0, 0), 0, color='green', alpha=0.5, label="Outer HZ", animated=blit)
+        self.inner_hz = Circle((0, 0), 0, color='blue', alpha=0.5, label="Inner HZ", animated=blit)
+        ax.add_patch(self.outer_hz)
+        ax.add_patch(self.inner_hz)
+
+        # Orbit outlines, only filled in while an animation runs
+        self.orbits = LineCollection([], colors='gray', linewidths=0.5, alpha=0.6)
+        ax.add_collection(self.orbits, autolim=False)
+
+        # Every planet lives in one PathCollection, however many there are
+        self.planets = ax.scatter(np.empty(0), np.empty(0), s=MARKER_SIZE, color='red', zorder=3, animated=blit)
+        self._edge_width = self.planets.get_linewidths()
+        self.labels = []
+        self.hover_label = ax.annotate("", (0, 0), xytext=(6, 6), textcoords="offset points", fontsize=8,
+                                       visible=False, animated=blit)
+        self._planet_labels = []
+
+        star = Circle((0, 0), 0.03, color='yellow', label="Star")
+        ax.add_patch(star)
+
+        ax.set_xlabel("AU (Astronomical Units)")
+        ax.set_ylabel("AU (Astronomical Units)")
+        ax.set_title("Exoplanets and Habitable Zone")
+        with span("legend"):
+            ax.legend()
+        ax.grid()
+
+        self.figure.canvas.mpl_connect("draw_event", self._on_draw)
+        self.figure.canvas.mpl_connect("motion_notify_event", self._on_hover)
+
+    def update(self, luminosity, exoplanets, planet_labels, redraw=True, temperature=None):
+        with span("SystemPlot.update", planets=len(exoplanets)):
+            self.stop_animation()
+            with span("hz_circles"):
+                d_inner, d_outer = hz_bounds(luminosity, temperature, self.hz_model)
+                self.inner_hz.set_radius(float(d_inner))
+                self.outer_hz.set_radius(float(d_outer))
+
+            with span("planet_markers"):
+                exoplanets = np.asarray(exoplanets, dtype=np.float64)
+                angles = np.radians(np.arange(len(exoplanets)) * (360 / max(len(exoplanets), 1)))
+                x = exoplanets * np.cos(angles)
+                y = exoplanets * np.sin(angles)
+                self.planets.set_offsets(np.column_stack((x, y)))
+
+            with span("planet_labels"):
+                self._planet_labels = planet_labels = list(planet_labels)
+                self.hover_label.set_visible(False)
+                crowded = len(planet_labels) > LABEL_LIMIT
+                self.planets.set_sizes([CROWDED_MARKER_SIZE if crowded else MARKER_SIZE])
+                self.planets.set_antialiased(not crowded)
+                self.planets.set_linewidths(0 if crowded else self._edge_width)
+                if crowded:
+                    planet_labels = []
+                while len(self.labels) < len(planet_labels):
+                    self.labels.append(self.ax.text(0, 0, "", fontsize=8, color='black', ha='center',
+                                                    va='center', animated=self.blit))
+                for i, text in enumerate(self.labels):
+                    if i < len(planet_labels):
+                        text.set_position((x[i] + 0.1, y[i]))
+                        text.set_text(planet_labels[i])
+                    text.set_visible(i < len(planet_labels))
+
+            if redraw:
+                self.redraw()
+
+    def animate(self, positions, paths=None, interval=1000 / ANIMATION_FPS):
+        # Replays a precomputed (frames x planets x 2) position table, such as
+        # orbits.orbital_positions returns, in a loop on a canvas timer; each
+        # frame only moves the planet offsets and redraws (blits, with
+        # `blit=True`) the animated artists over the cached background.
+        self.stop_animation()
+        for text in self.labels:
+            text.set_visible(False)
+        if paths is not None:
+            self.orbits.set_segments(paths)
+        self._positions = positions
+        self._frame = 0
+        self._animation = self.figure.canvas.new_timer(interval=interval)
+        self._animation.add_callback(self._next_frame)
+        self._animation.start()
+        self.figure.canvas.draw_idle()
+        return self._animation
+
+    def animate_orbits(self, semi_major_axis, eccentricity, period, frames=ANIMATION_FRAMES):
+        # One loop covers a full orbit of the slowest planet that is on screen
+        semi_major_axis = np.asarray(semi_major_axis, dtype=np.float64)
+        period = fill_missing_periods(period, semi_major_axis)
+        visible = period[semi_major_axis <= PLOT_LIMIT_AU * np.sqrt(2)]
+        duration = np.nanmax(visible) if np.isfinite(visible).any() else np.nanmax(period)
+        times = np.linspace(0, duration, frames, endpoint=False)
+        positions = orbital_positions(semi_major_axis, eccentricity, period, times)
+        return self.animate(positions, orbit_paths(semi_major_axis, eccentricity))
+
+    def stop_animation(self):
+        if self._animation is None:
+            return
+        self._animation.stop()
+        self._animation = self._positions = None
+        self.orbits.set_segments([])
+
+    def show_frame(self, frame):
+        self.planets.set_offsets(self._positions[frame])
+        self.redraw()
+
+    def _next_frame(self):
+        self.show_frame(self._frame)
+        self._frame = (self._frame + 1) % len(self._positions)
+
+    @traced("SystemPlot.redraw")
+    def redraw(self):
+        canvas = self.figure.canvas
+        if not self.blit or self._background is None:
+            canvas.draw_idle()
+            return
+        canvas.restore_region(self._background)
+        self._draw_animated()
+        canvas.blit(self.figure.bbox)
+
+    def _animated_artists(self):
+        return [self.outer_hz, self.inner_hz, self.planets, *self.labels, self.hover_label]
+
+    def _draw_animated(self):
+        for artist in self._animated_artists():
+            self.ax.draw_artist(artist)
+
+    def _on_hover(self, event):
+        if event.inaxes is not self.ax:
+            return
+        hit, info = self.planets.contains(event)
+        if hit:
+            i = info["ind"][0]
+            self.hover_label.xy = self.planets.get_offsets()[i]
+            self.hover_label.set_text(self._planet_labels[i] if i < len(self._planet_labels) else "")
+            self.hover_label.set_visible(True)
+        elif not self.hover_label.get_visible():
+            return
+        else:
+            self.hover_label.set_visible(False)
+        self.redraw()
+
+    def _on_draw(self, event):
+        # A full draw (first show, resize) invalidates the cached background.
+        if not self.blit:
+            return
+        canvas = self.figure.canvas
+        self._background = canvas.copy_from_bbox(self.figure.bbox)
+        self._draw_animated()
+
+
+def create_plot(luminosity, exoplanets, planet_labels, show=True, temperature=None, hz_model=SIMPLE_MODEL):
+    # pyplot is imported here rather than at module level so the catalog and
+    # HZ math can be used on display-less workers without loading matplotlib.
+    with span("create_plot", planets=len(exoplanets)):
+        import matplotlib.pyplot as plt
+
+        with span("pyplot.figure"):
+            fig = plt.figure(figsize=(8, 8))
+        SystemPlot(fig, hz_model=hz_model).update(luminosity, exoplanets, planet_labels, temperature=temperature)
+
+    if show:
+        plt.show()
+    return fig
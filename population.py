@@ -0,0 +1,183 @@
+import argparse
+import sys
+from collections import namedtuple
+from functools import cache
+
+import numpy as np
+
+from habitable_zone import HZ_INNER_FACTOR, HZ_OUTER_FACTOR
+from tracing import span, traced
+
+# Bins per axis over the visible range, so zooming in gains resolution
+DEFAULT_BINS = 200
+# log10 luminosity span of the drawn HZ band, wide enough for any view
+HZ_BAND_LOG_LUMINOSITY = (-10.0, 10.0)
+# Fraction of the data range left empty around it in the initial view
+VIEW_MARGIN = 0.05
+
+PopulationDensity = namedtuple("PopulationDensity", ["counts", "x_edges", "y_edges", "planets"])
+
+
+class PopulationIndex:
+    # Every planet as a point (log10 a, log10 L) of its semi-major axis and
+    # host luminosity, sorted by log10 a.  A view's x range is then a slice
+    # found by two binary searches, and only the points in that slice are
+    # binned.  Planets with a missing or non-positive a or L are left out.
+
+    def __init__(self, log_semi_major_axis, log_luminosity):
+        self.x = log_semi_major_axis
+        self.y = log_luminosity
+
+    @classmethod
+    def from_sorted(cls, semi_major_axis, planet_luminosity):
+        # `semi_major_axis` is a SortedIndex; `planet_luminosity` has one value
+        # per planet in catalog order
+        a = semi_major_axis.values[:semi_major_axis.valid]
+        luminosity = planet_luminosity[semi_major_axis.order[:semi_major_axis.valid]]
+        keep = (a > 0) & (luminosity > 0) & np.isfinite(luminosity)
+        return cls(np.log10(a[keep]), np.log10(luminosity[keep]))
+
+    def __len__(self):
+        return len(self.x)
+
+    @property
+    def extent(self):
+        # (x_min, x_max, y_min, y_max) of the points, in log10 units
+        if not len(self):
+            return 0.0, 1.0, 0.0, 1.0
+        return float(self.x[0]), float(self.x[-1]), float(self.y.min()), float(self.y.max())
+
+    def density(self, x_range, y_range, bins=DEFAULT_BINS):
+        # Counts of the points inside the view on a bins x bins grid that is
+        # uniform in log10 a and log10 L, i.e. log-spaced in a and L.  counts
+        # is indexed [y, x], as images are.
+        (x0, x1), (y0, y1) = sorted(x_range), sorted(y_range)
+        nx, ny = (bins, bins) if np.ndim(bins) == 0 else bins
+        start, stop = np.searchsorted(self.x, x0, "left"), np.searchsorted(self.x, x1, "right")
+        x, y = self.x[start:stop], self.y[start:stop]
+        inside = (y >= y0) & (y <= y1)
+        x, y = x[inside], y[inside]
+        # Direct index arithmetic plus one bincount is several times faster
+        # than histogram2d, which searches the edges for every point
+        column = np.minimum(((x - x0) * (nx / max(x1 - x0, 1e-12))).astype(np.intp), nx - 1)
+        row = np.minimum(((y - y0) * (ny / max(y1 - y0, 1e-12))).astype(np.intp), ny - 1)
+        counts = np.bincount(row * nx + column, minlength=nx * ny).reshape(ny, nx)
+        return PopulationDensity(counts, np.linspace(x0, x1, nx + 1), np.linspace(y0, y1, ny + 1), len(x))
+
+
+@cache
+def _density_image_type():
+    # Built on first use so importing this module does not import matplotlib
+    from matplotlib.image import AxesImage
+
+    class DensityImage(AxesImage):
+        # Rebins for the current view just before drawing, so a pan or zoom
+        # that changes both axis limits costs a single pass
+        def __init__(self, ax, plot, **kwargs):
+            super().__init__(ax, **kwargs)
+            self.population_plot = plot
+
+        def draw(self, renderer):
+            self.population_plot.rebin()
+            super().draw(renderer)
+
+    return DensityImage
+
+
+class PopulationPlot:
+    # Catalog-wide view of host luminosity against semi-major axis, drawn as a
+    # density image rather than one marker per planet, with the simple HZ
+    # band (0.95 to 1.37 x sqrt(L)) overlaid.  Axes are in log10 units with
+    # ticks labelled in AU and solar luminosities.
+
+    @traced("PopulationPlot.setup")
+    def __init__(self, index, figure=None, bins=DEFAULT_BINS):
+        from matplotlib.colors import LogNorm
+        from matplotlib.figure import Figure
+        from matplotlib.ticker import FuncFormatter
+
+        self.index = index
+        self.bins = bins
+        self.figure = figure if figure is not None else Figure(figsize=(8, 8))
+        self._view = None
+        self.density = None
+
+        ax = self.ax = self.figure.add_subplot()
+        self.image = _density_image_type()(ax, self, cmap="viridis", norm=LogNorm(1, 2), origin="lower",
+                                           interpolation="nearest")
+        self.image.set_data(np.ma.masked_all((1, 1)))
+        ax.add_image(self.image)
+
+        # In log space the HZ edges are straight lines: log a = log k + log L / 2
+        log_luminosity = np.array(HZ_BAND_LOG_LUMINOSITY)
+        inner = np.log10(HZ_INNER_FACTOR) + log_luminosity / 2
+        outer = np.log10(HZ_OUTER_FACTOR) + log_luminosity / 2
+        ax.fill_betweenx(log_luminosity, inner, outer, color='green', alpha=0.25, zorder=2,
+                         label=f"HZ ({HZ_INNER_FACTOR}-{HZ_OUTER_FACTOR} x sqrt(L))")
+        ax.plot(inner, log_luminosity, color='blue', linewidth=1, zorder=2)
+        ax.plot(outer, log_luminosity, color='green', linewidth=1, zorder=2)
+
+        x0, x1, y0, y1 = index.extent
+        x_margin, y_margin = max(x1 - x0, 1) * VIEW_MARGIN, max(y1 - y0, 1) * VIEW_MARGIN
+        ax.set_xlim(x0 - x_margin, x1 + x_margin)
+        ax.set_ylim(y0 - y_margin, y1 + y_margin)
+
+        power_of_ten = FuncFormatter(lambda value, position: f"{10 ** value:.3g}")
+        ax.xaxis.set_major_formatter(power_of_ten)
+        ax.yaxis.set_major_formatter(power_of_ten)
+        ax.set_xlabel("Semi-major axis (AU, log scale)")
+        ax.set_ylabel("Host luminosity (Solar luminosity, log scale)")
+        ax.set_title(f"Exoplanet Population ({len(index)} planets)")
+        ax.legend(loc="upper left")
+        self.colorbar = self.figure.colorbar(self.image, ax=ax, label="Planets per bin")
+
+    def rebin(self):
+        # Recomputes the image for the current limits; a no-op while they are unchanged
+        view = (tuple(self.ax.get_xlim()), tuple(self.ax.get_ylim()))
+        if view == self._view:
+            return
+        self._view = view
+        with span("PopulationPlot.rebin", planets=len(self.index)):
+            self.density = density = self.index.density(*view, self.bins)
+            self.image.set_data(np.ma.masked_equal(density.counts, 0))  # empty bins stay transparent
+            self.image.set_extent((density.x_edges[0], density.x_edges[-1], density.y_edges[0],
+                                   density.y_edges[-1]))
+            self.image.set_clim(1, max(int(density.counts.max()), 2))
+
+
+def create_population_plot(catalog, show=True, bins=DEFAULT_BINS):
+    # Opens the population view in a pyplot window, whose toolbar pans and zooms
+    import matplotlib.pyplot as plt
+
+    fig = plt.figure(figsize=(9, 8))
+    PopulationPlot(catalog.index.population, fig, bins)
+    if show:
+        plt.show()
+    return fig
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Density map of host luminosity against semi-major axis for "
+                                                 "every planet in the catalog.")
+    parser.add_argument("catalog", nargs="?", help="archive CSV export (default: the bundled systems)")
+    parser.add_argument("--output", help="write the figure to this file instead of opening a window")
+    parser.add_argument("--bins", type=int, default=DEFAULT_BINS, help="bins per axis over the visible range")
+    args = parser.parse_args(argv)
+
+    from catalog_loader import load_catalog
+
+    catalog = load_catalog(args.catalog)
+    if args.output:
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+
+        plot = PopulationPlot(catalog.index.population, Figure(figsize=(9, 8)), args.bins)
+        FigureCanvasAgg(plot.figure)
+        plot.figure.savefig(args.output)
+    else:
+        create_population_plot(catalog, bins=args.bins)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,140 @@
+import hashlib
+import io
+import os
+import tempfile
+from collections import OrderedDict, namedtuple
+
+import numpy as np
+
+from habitable_zone import SIMPLE_MODEL
+from plotting import LABEL_LIMIT, PLOT_LIMIT_AU, SystemPlot
+from tracing import span
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+# Bump when SystemPlot's look changes so stale on-disk renders are not reused
+RENDER_VERSION = 1
+
+CacheStats = namedtuple("CacheStats", ["hits", "disk_hits", "misses", "evictions", "entries", "bytes"])
+
+
+def render_key(luminosity, exoplanets, planet_labels, settings, temperature=None):
+    # Content address of one rendered plot: the plot inputs plus every setting
+    # that changes the output bytes.
+    digest = hashlib.sha256()
+    digest.update(repr((RENDER_VERSION, PLOT_LIMIT_AU, LABEL_LIMIT, sorted(settings.items()))).encode())
+    digest.update(np.float64(luminosity).tobytes())
+    digest.update(np.float64(np.nan if temperature is None else temperature).tobytes())
+    digest.update(np.ascontiguousarray(exoplanets, dtype=np.float64).tobytes())
+    digest.update("\0".join(map(str, planet_labels)).encode())
+    return digest.hexdigest()
+
+
+def atomic_write(path, data):
+    # Write to a temporary file and rename so readers never see a partial file
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    fd, temporary = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as file:
+            file.write(data)
+        os.replace(temporary, path)
+    except BaseException:
+        os.unlink(temporary)
+        raise
+
+
+class RenderCache:
+    # In-memory LRU of encoded images bounded by total size, with an optional
+    # on-disk tier that survives restarts and is shared between processes.
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES, directory=None):
+        self.max_bytes = max_bytes
+        self.directory = directory
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._hits = self._disk_hits = self._misses = self._evictions = 0
+
+    def get(self, key):
+        data = self._entries.get(key)
+        if data is not None:
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return data
+        data = self._read_disk(key)
+        if data is not None:
+            self._disk_hits += 1
+            self._remember(key, data)
+            return data
+        self._misses += 1
+        return None
+
+    def put(self, key, data):
+        self._remember(key, data)
+        self._write_disk(key, data)
+
+    def clear(self):
+        # Drops the memory tier only; the on-disk tier is left in place.
+        self._entries.clear()
+        self._bytes = 0
+
+    @property
+    def stats(self):
+        return CacheStats(self._hits, self._disk_hits, self._misses, self._evictions,
+                          len(self._entries), self._bytes)
+
+    def _remember(self, key, data):
+        if key in self._entries:
+            self._bytes -= len(self._entries.pop(key))
+        if len(data) > self.max_bytes:
+            return
+        self._entries[key] = data
+        self._bytes += len(data)
+        while self._bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= len(evicted)
+            self._evictions += 1
+
+    def _path(self, key):
+        return os.path.join(self.directory, key[:2], key)
+
+    def _read_disk(self, key):
+        if self.directory is None:
+            return None
+        try:
+            with open(self._path(key), "rb") as file:
+                return file.read()
+        except FileNotFoundError:
+            return None
+
+    def _write_disk(self, key, data):
+        if self.directory is not None:
+            atomic_write(self._path(key), data)
+
+
+class CachedRenderer:
+    # Headless renderer that reuses one Agg figure and serves repeated inputs
+    # from a RenderCache instead of redrawing.
+
+    def __init__(self, cache=None, figsize=(8, 8), dpi=100, hz_model=SIMPLE_MODEL):
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+
+        self.cache = cache if cache is not None else RenderCache()
+        self.settings = {"figsize": tuple(figsize), "dpi": dpi, "hz_model": hz_model}
+        self.plot = SystemPlot(Figure(figsize=figsize, dpi=dpi), hz_model=hz_model)
+        FigureCanvasAgg(self.plot.figure)
+
+    def render(self, luminosity, exoplanets, planet_labels, format="png", temperature=None):
+        with span("CachedRenderer.render", planets=len(exoplanets), format=format) as render_span:
+            key = render_key(luminosity, exoplanets, planet_labels, {**self.settings, "format": format}, temperature)
+            data = self.cache.get(key)
+            if render_span is not None:
+                render_span.args["cache_hit"] = data is not None
+            if data is None:
+                self.plot.update(luminosity, exoplanets, planet_labels, redraw=False, temperature=temperature)
+                with span("savefig"):
+                    buffer = io.BytesIO()
+                    self.plot.figure.savefig(buffer, format=format, dpi=self.settings["dpi"])
+                data = buffer.getvalue()
+                self.cache.put(key, data)
+        return data
@@ -0,0 +1,157 @@
+import threading
+import time
+from collections import namedtuple
+
+import numpy as np
+
+from habitable_zone import SIMPLE_MODEL
+from plotting import SystemPlot
+from render_cache import render_key
+from tracing import span
+
+RenderJob = namedtuple("RenderJob", ["generation", "luminosity", "exoplanets", "planet_labels", "temperature",
+                                     "size_inches", "dpi", "hz_model", "submitted"])
+RenderResult = namedtuple("RenderResult", ["generation", "image", "latency", "error"])
+RenderStats = namedtuple("RenderStats", ["queue_depth", "submitted", "completed", "dropped", "last_latency",
+                                         "mean_latency"])
+
+
+class BackgroundRenderer:
+    # Renders SystemPlot figures to RGBA arrays on a worker thread that owns
+    # its own Agg figure, so the Tk thread only has to blit the pixels.
+    # Matplotlib makes no thread-safety guarantee; this relies on the worker's
+    # figure being created and drawn only on the worker thread and sharing
+    # no artists with the GUI figure.  Shared module state (font and text
+    # layout caches, rcParams) is not locked, so rcParams must not change
+    # while the worker runs.
+    # Only the newest request matters: submitting replaces a request that has
+    # not started yet, and a render that finishes after a newer submit (or a
+    # cancel) is dropped instead of delivered.  An optional RenderCache keeps
+    # recent images, keyed like CachedRenderer's.
+
+    def __init__(self, cache=None):
+        self.cache = cache
+        self._condition = threading.Condition()
+        self._pending = None
+        self._running = None
+        self._result = None
+        self._generation = 0
+        self._closed = False
+        self._submitted = self._completed = self._dropped = 0
+        self._last_latency = self._total_latency = 0.0
+        self._plot = None
+        self._thread = threading.Thread(target=self._run, name="render-worker", daemon=True)
+        self._thread.start()
+
+    def submit(self, luminosity, exoplanets, planet_labels, temperature=None, size_inches=(8, 8), dpi=100,
+               hz_model=SIMPLE_MODEL):
+        # Queues a render and returns its generation number.  The inputs are
+        # copied, so the caller may reuse its arrays.
+        with self._condition:
+            self._generation += 1
+            if self._pending is not None:
+                self._dropped += 1
+            self._pending = RenderJob(self._generation, float(luminosity), np.array(exoplanets, dtype=np.float64),
+                                      list(map(str, planet_labels)), temperature, tuple(size_inches), dpi, hz_model,
+                                      time.perf_counter())
+            self._submitted += 1
+            self._result = None
+            self._condition.notify_all()
+            return self._generation
+
+    def cancel(self):
+        # Drops the queued request and discards the one in progress, if any
+        with self._condition:
+            self._generation += 1
+            if self._pending is not None:
+                self._pending = None
+                self._dropped += 1
+            self._result = None
+
+    def poll(self):
+        # The newest finished render, or None.  Never blocks, so the Tk thread
+        # can call it from an `after` loop.
+        with self._condition:
+            result, self._result = self._result, None
+            return result
+
+    def wait(self, timeout=None):
+        # Blocks until the newest request has finished (or was cancelled) and
+        # returns its result, or None on timeout or cancellation.
+        with self._condition:
+            self._condition.wait_for(lambda: self._pending is None and self._running is None, timeout)
+            result, self._result = self._result, None
+            return result
+
+    @property
+    def stats(self):
+        with self._condition:
+            depth = (self._pending is not None) + (self._running is not None)
+            mean = self._total_latency / self._completed if self._completed else 0.0
+            return RenderStats(depth, self._submitted, self._completed, self._dropped, self._last_latency, mean)
+
+    def close(self):
+        with self._condition:
+            self._closed = True
+            self._pending = None
+            self._condition.notify_all()
+        self._thread.join()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._pending is not None or self._closed)
+                if self._closed:
+                    return
+                job, self._pending = self._pending, None
+                self._running = job
+            try:
+                with span("BackgroundRenderer.render", planets=len(job.exoplanets), generation=job.generation):
+                    image, error = self._render(job), None
+            except Exception as exception:
+                image, error = None, exception
+            with self._condition:
+                self._running = None
+                if job.generation != self._generation:
+                    self._dropped += 1
+                else:
+                    latency = time.perf_counter() - job.submitted
+                    self._result = RenderResult(job.generation, image, latency, error)
+                    self._completed += 1
+                    self._last_latency = latency
+                    self._total_latency += latency
+                self._condition.notify_all()
+
+    def _render(self, job):
+        settings = {"figsize": job.size_inches, "dpi": job.dpi, "hz_model": job.hz_model, "format": "rgba"}
+        width, height = (int(round(size * job.dpi)) for size in job.size_inches)
+        key = None
+        if self.cache is not None:
+            key = render_key(job.luminosity, job.exoplanets, job.planet_labels, settings, job.temperature)
+            data = self.cache.get(key)
+            if data is not None:
+                return np.frombuffer(data, dtype=np.uint8).reshape(height, width, 4)
+
+        plot = self._figure(job)
+        plot.update(job.luminosity, job.exoplanets, job.planet_labels, redraw=False, temperature=job.temperature)
+        with span("draw"):
+            plot.figure.canvas.draw()
+            image = np.array(plot.figure.canvas.buffer_rgba())
+        if key is not None and image.shape == (height, width, 4):
+            self.cache.put(key, image.tobytes())
+        return image
+
+    def _figure(self, job):
+        # The worker's own figure, resized to match the requesting canvas
+        if self._plot is None:
+            from matplotlib.backends.backend_agg import FigureCanvasAgg
+            from matplotlib.figure import Figure
+
+            self._plot = SystemPlot(Figure(figsize=job.size_inches, dpi=job.dpi))
+            FigureCanvasAgg(self._plot.figure)
+        figure = self._plot.figure
+        if tuple(figure.get_size_inches()) != job.size_inches or figure.dpi != job.dpi:
+            figure.set_dpi(job.dpi)
+            figure.set_size_inches(job.size_inches)
+        self._plot.hz_model = job.hz_model
+        return self._plot
@@ -0,0 +1,158 @@
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+
+import numpy as np
+
+from catalog import PLANET_TEXT_COLUMNS, STAR_COLUMNS, Catalog, StringColumn
+from validation import Issue
+
+SNAPSHOT_FORMAT = "hz-catalog"
+# Bumped when the layout, or how a source file is turned into a catalog, changes
+SNAPSHOT_VERSION = 4
+MANIFEST = "manifest.json"
+BUNDLED_SOURCE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "systems_data.py")
+
+
+def source_fingerprint(path):
+    # Changes whenever the source file is edited or replaced
+    stat = os.stat(path)
+    return {"path": os.path.abspath(path), "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def default_snapshot_dir(source_path=None):
+    if source_path is not None:
+        return os.path.abspath(source_path) + ".snapshot"
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(cache_home, "exoplanet-hz", "bundled.snapshot")
+
+
+def snapshot_path(directory, source=None):
+    # Each snapshot lives in its own subdirectory of `directory`, named after
+    # the format version and the source fingerprint
+    digest = hashlib.sha1(json.dumps(source, sort_keys=True).encode()).hexdigest()[:16]
+    return os.path.join(directory, f"v{SNAPSHOT_VERSION}-{digest}")
+
+
+def save_snapshot(catalog, directory, source=None):
+    # Writes the snapshot into a fresh temporary directory and publishes it
+    # with one rename, then returns its path.  A published snapshot is never
+    # modified, so readers in other processes see all of it or none of it.
+    # When another process has already published the same snapshot, its copy
+    # is kept and this one is discarded.
+    os.makedirs(directory, exist_ok=True)
+    path = snapshot_path(directory, source)
+    temporary = tempfile.mkdtemp(dir=directory, prefix=".tmp-")
+    try:
+        _write_snapshot(catalog, temporary, source)
+        try:
+            os.rename(temporary, path)
+        except OSError:
+            if read_manifest(path) is None:
+                raise
+            shutil.rmtree(temporary, ignore_errors=True)
+    except BaseException:
+        shutil.rmtree(temporary, ignore_errors=True)
+        raise
+    _remove_stale(directory, path)
+    return path
+
+
+def read_manifest(directory):
+    try:
+        with open(os.path.join(directory, MANIFEST)) as file:
+            manifest = json.load(file)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+    if manifest.get("format") != SNAPSHOT_FORMAT or manifest.get("version") != SNAPSHOT_VERSION:
+        return None
+    return manifest
+
+
+def load_snapshot(directory):
+    # Every column is memory-mapped read-only; processes opening the same
+    # snapshot share its pages.
+    manifest = read_manifest(directory)
+    if manifest is None:
+        raise FileNotFoundError(f"No usable catalog snapshot in {directory!r}.")
+
+    def load(name):
+        return np.load(os.path.join(directory, name + ".npy"), mmap_mode="r")
+
+    def text(name):
+        return StringColumn(load(f"{name}.data"), load(f"{name}.bounds"))
+
+    return Catalog(
+        text("names"),
+        {column: load(f"star.{column}") for column in STAR_COLUMNS},
+        load("offsets"),
+        load("semi_major_axis"),
+        {column: text(f"planet.{column}") for column in PLANET_TEXT_COLUMNS},
+        [Issue(*issue) for issue in manifest.get("issues", [])],
+    )
+
+
+def load_or_build(source_path, build, directory=None):
+    # Maps the snapshot for `source_path` when it is current, otherwise calls
+    # `build()` and publishes a new snapshot.  A snapshot that cannot be
+    # written (read-only location) or mapped (removed by a concurrent rebuild)
+    # just means the built catalog is used as is.
+    directory = directory or default_snapshot_dir(None if source_path == BUNDLED_SOURCE else source_path)
+    source = source_fingerprint(source_path)
+    path = snapshot_path(directory, source)
+    manifest = read_manifest(path)
+    if manifest is not None and manifest.get("source") == source:
+        try:
+            return load_snapshot(path)
+        except (OSError, ValueError):
+            pass
+
+    catalog = build()
+    try:
+        return load_snapshot(save_snapshot(catalog, directory, source))
+    except (OSError, ValueError):
+        return catalog
+
+
+def _write_snapshot(catalog, directory, source):
+    arrays = {"offsets": catalog.offsets, "semi_major_axis": catalog.semi_major_axis}
+    arrays.update({f"star.{column}": catalog.star_columns[column] for column in STAR_COLUMNS})
+    texts = {"names": catalog.names}
+    texts.update({f"planet.{column}": catalog.planet_columns[column] for column in PLANET_TEXT_COLUMNS})
+    for name, values in texts.items():
+        column = values if isinstance(values, StringColumn) else StringColumn.from_strings(values)
+        arrays[f"{name}.data"] = column.data
+        arrays[f"{name}.bounds"] = column.bounds
+    for name, array in arrays.items():
+        with open(os.path.join(directory, name + ".npy"), "wb") as file:
+            np.save(file, np.ascontiguousarray(array))
+
+    manifest = {
+        "format": SNAPSHOT_FORMAT,
+        "version": SNAPSHOT_VERSION,
+        "source": source,
+        "systems": len(catalog),
+        "planets": catalog.planet_count,
+        "issues": [list(issue) for issue in catalog.issues],
+    }
+    with open(os.path.join(directory, MANIFEST), "w") as file:
+        json.dump(manifest, file)
+
+
+def _remove_stale(directory, current):
+    # Best effort: snapshots of older sources or versions, and the files of
+    # the flat layout used before version 4.  Other writers' temporary
+    # directories are left alone.  Processes that already mapped a removed
+    # snapshot keep their pages.
+    for entry in os.scandir(directory):
+        if entry.path == current or entry.name.startswith(".tmp-"):
+            continue
+        if entry.is_dir(follow_symlinks=False):
+            shutil.rmtree(entry.path, ignore_errors=True)
+        elif entry.name == MANIFEST or entry.name.endswith(".npy"):
+            try:
+                os.unlink(entry.path)
+            except OSError:
+                pass
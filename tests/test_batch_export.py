@@ -0,0 +1,17 @@
+from batch_export import output_filenames
+
+
+def test_distinct_names_keep_their_filenames():
+    assert output_filenames(["Kepler-442", "HD 40307"], [0, 5], "png") == ["Kepler-442.png", "HD_40307.png"]
+
+
+def test_colliding_names_get_their_catalog_index():
+    names = ["A B", "A_B", "A/B", "a b", "C"]
+    files = output_filenames(names, [3, 7, 8, 9, 10], "svg")
+    assert files == ["A_B_3.svg", "A_B_7.svg", "A_B_8.svg", "a_b_9.svg", "C.svg"]
+
+
+def test_suffixed_names_do_not_collide_with_other_systems():
+    files = output_filenames(["A B", "A_B", "A_B_3"], [3, 7, 8], "png")
+    assert len({file.casefold() for file in files}) == 3
+    assert files[2] == "A_B_3.png"
@@ -0,0 +1,19 @@
+import numpy as np
+
+from catalog import load_default_catalog
+from habitable_zone import KOPPARAPU_MODEL, SIMPLE_MODEL
+
+
+def test_planets_in_hz_follows_the_model():
+    catalog = load_default_catalog()
+    index = catalog.index
+    mars = list(catalog.planet_columns["planet_labels"]).index("4.Mars")
+    system = int(np.searchsorted(catalog.offsets, mars, "right")) - 1
+
+    assert mars not in index.planets_in_hz([system])
+    assert mars in index.planets_in_hz([system], model=KOPPARAPU_MODEL)
+    assert mars in index.planets_in_hz(model=KOPPARAPU_MODEL)
+    # Each model's zones are cached separately and match a fresh classification
+    for model in (SIMPLE_MODEL, KOPPARAPU_MODEL):
+        np.testing.assert_array_equal(index.zones(model), catalog.classify(model).zone)
+        assert index.zones(model) is index.zones(model)
@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+
+from catalog_loader import load_csv
+
+HEADER = "hostname,pl_name,pl_orbsmax,st_rad,st_teff,st_lum,sy_dist"
+
+
+def write_csv(tmp_path, rows, header=HEADER):
+    path = tmp_path / "archive.csv"
+    path.write_text("# archive comment\n" + "\n".join([header, *rows]) + "\n")
+    return path
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 50])
+def test_first_row_with_a_stellar_value_wins(tmp_path, chunk_size):
+    path = write_csv(tmp_path, [
+        "X,X b,0.1,1,5000,,10",
+        "X,X c,0.2,2,6000,,20",
+        "Y,Y b,1.0,,,0.5,",
+    ])
+    catalog = load_csv(path, chunk_size=chunk_size)
+
+    x = catalog.index.system_index("X")
+    assert catalog.radius[x] == 1
+    assert catalog.temperature[x] == 5000
+    assert catalog.luminosity[x] == pytest.approx((5000 / 5772) ** 4)
+    assert catalog.distance[x] == pytest.approx(10 * 3.26156)
+    y = catalog.index.system_index("Y")
+    assert catalog.luminosity[y] == pytest.approx(10 ** 0.5)
+    assert np.isnan(catalog.radius[y])
+
+
+def test_later_row_fills_a_missing_stellar_value(tmp_path):
+    path = write_csv(tmp_path, ["X,X b,0.1,,5000,,", "X,X c,0.2,2,6000,,"])
+    catalog = load_csv(path)
+    assert catalog.radius[0] == 2
+    assert catalog.temperature[0] == 5000
+
+
+def test_planets_are_grouped_by_host_in_file_order(tmp_path):
+    path = write_csv(tmp_path, [
+        "X,X b,0.1,1,5000,,",
+        "Y,Y b,1.0,1,5000,,",
+        "X,X c,0.2,1,5000,,",
+    ])
+    catalog = load_csv(path, chunk_size=2)
+    assert list(catalog.names) == ["X", "Y"]
+    assert catalog.planet_counts.tolist() == [2, 1]
+    assert catalog.semi_major_axis.tolist() == [0.1, 0.2, 1.0]
+    assert catalog.planet_columns["planet_labels"].tolist() == ["1. X b", "2. X c", "1. Y b"]
+
+
+def test_planetary_systems_export_uses_default_solutions_only(tmp_path):
+    path = write_csv(tmp_path, [
+        "X,X b,0.11,3,7000,,,0",
+        "X,X b,0.1,1,5000,,,1",
+        "X,X b,0.12,2,6000,,,0",
+        "X,X c,0.2,,,,,1",
+    ], header=HEADER + ",default_flag")
+    catalog = load_csv(path)
+    assert catalog.planet_count == 2
+    assert catalog.semi_major_axis.tolist() == [0.1, 0.2]
+    assert catalog.radius[0] == 1
+
+
+def test_missing_required_column_is_reported(tmp_path):
+    path = write_csv(tmp_path, ["X,1"], header="hostname,pl_name")
+    with pytest.raises(ValueError, match="pl_orbsmax"):
+        load_csv(path)
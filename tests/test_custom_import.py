@@ -0,0 +1,87 @@
+import json
+
+import pytest
+
+from catalog import load_default_catalog
+from custom_import import (BAD_AXIS, BAD_LUMINOSITY, DUPLICATE_NAME, INVALID_JSON, LABEL_MISMATCH, MISSING_NAME,
+                           NO_PLANETS, NONPOSITIVE_AXIS, NONPOSITIVE_LUMINOSITY, format_report, import_into,
+                           import_systems)
+
+
+def write_jsonl(tmp_path, records, name="systems.jsonl"):
+    path = tmp_path / name
+    path.write_text("\n".join(record if isinstance(record, str) else json.dumps(record) for record in records) + "\n")
+    return str(path)
+
+
+def test_csv_rejection_reasons_carry_line_numbers(tmp_path):
+    path = tmp_path / "systems.csv"
+    path.write_text(
+        "# comment lines are skipped\n"
+        "name,luminosity,temperature,exoplanets,planet_labels\n"
+        'A,1,5772,"0.5,1.0","A b,A c"\n'  # line 3
+        ',1,5772,1.0,\n'                   # line 4
+        'C,bright,5772,1.0,\n'             # line 5
+        'D,-1,5772,1.0,\n'                 # line 6
+        'E,1,5772,,\n'                     # line 7
+        'F,1,5772,"1.0,x",\n'              # line 8
+        'G,1,5772,"1.0,0",\n'              # line 9
+        'H,1,5772,"1.0,2.0",H b\n'         # line 10
+    )
+    report = import_systems(str(path))
+
+    assert report.imported == 1 and report.rejected == 7
+    assert {reason: problem.lines for reason, problem in report.problems.items()} == {
+        MISSING_NAME: [4], BAD_LUMINOSITY: [5], NONPOSITIVE_LUMINOSITY: [6], NO_PLANETS: [7],
+        BAD_AXIS: [8], NONPOSITIVE_AXIS: [9], LABEL_MISMATCH: [10],
+    }
+    assert report.catalog.planet_columns["planet_labels"].tolist() == ["A b", "A c"]
+    assert "rejected 7" in format_report(report, str(path))
+
+
+def test_json_lines_report_unreadable_lines(tmp_path):
+    path = write_jsonl(tmp_path, [{"name": "A", "luminosity": 1, "exoplanets": [1.0]}, "{not json", "[1, 2]"])
+    report = import_systems(path)
+    assert report.imported == 1
+    assert report.problems[INVALID_JSON].lines == [2, 3]
+
+
+def test_default_labels_number_the_planets(tmp_path):
+    report = import_systems(write_jsonl(tmp_path, [{"name": "J", "luminosity": 1, "exoplanets": [0.5, 1.0]}]))
+    assert report.catalog.planet_columns["planet_labels"].tolist() == ["1. J", "2. J"]
+
+
+def test_names_already_taken_are_rejected(tmp_path):
+    bundled = load_default_catalog()
+    first = write_jsonl(tmp_path, [
+        {"name": "Sun", "luminosity": 2, "exoplanets": [1.0]},
+        {"name": "New", "luminosity": 1, "exoplanets": [1.0]},
+        {"name": "New", "luminosity": 3, "exoplanets": [2.0]},
+    ], "first.jsonl")
+    second = write_jsonl(tmp_path, [{"name": "New", "luminosity": 1, "exoplanets": [1.0]}], "second.jsonl")
+
+    catalog, reports = import_into(bundled, [first, second])
+
+    assert reports[0].imported == 1
+    assert reports[0].problems[DUPLICATE_NAME].lines == [1, 3]
+    assert reports[1].imported == 0 and reports[1].problems[DUPLICATE_NAME].lines == [1]
+    assert len(catalog) == len(bundled) + 1
+    assert list(catalog.names).count("Sun") == 1
+    assert catalog.luminosity[catalog.index.system_index("New")] == 1
+
+
+def test_chunking_does_not_change_the_result(tmp_path):
+    records = [{"name": f"S{i}", "luminosity": 1 + i, "exoplanets": [0.1 * (i + 1)]} for i in range(7)]
+    records.insert(3, {"name": "S1", "luminosity": 1, "exoplanets": [1.0]})
+    path = write_jsonl(tmp_path, records)
+    whole, chunked = import_systems(path), import_systems(path, chunk_size=2)
+    assert list(whole.catalog.names) == list(chunked.catalog.names)
+    assert whole.problems == chunked.problems
+
+
+@pytest.mark.parametrize("header", ["luminosity,exoplanets", "name,exoplanets"])
+def test_csv_without_required_columns_is_refused(tmp_path, header):
+    path = tmp_path / "systems.csv"
+    path.write_text(header + "\n")
+    with pytest.raises(ValueError, match="missing"):
+        import_systems(str(path))
@@ -0,0 +1,63 @@
+import asyncio
+import json
+
+import pytest
+
+from catalog import load_default_catalog
+from hz_service import HTTPError, HZService
+
+
+@pytest.fixture(scope="module")
+def service():
+    # No pool is started: every request here is answered before rendering
+    return HZService(load_default_catalog(), workers=1)
+
+
+def get(service, target, method="GET", body=b""):
+    status, content_type, payload = asyncio.run(service.dispatch(method, target, body))
+    return status, json.loads(payload)
+
+
+def status_of(service, target, method="GET", body=None):
+    try:
+        return get(service, target, method, b"" if body is None else json.dumps(body).encode())[0]
+    except HTTPError as error:
+        return error.status
+
+
+def test_hz_bounds(service):
+    status, bounds = get(service, "/hz?luminosity=4")
+    assert status == 200
+    assert bounds == {"inner": pytest.approx(1.9), "outer": pytest.approx(2.74)}
+
+
+@pytest.mark.parametrize("target", [
+    "/hz?luminosity=1&model=kopparapu",
+    "/hz?luminosity=1&model=kopparapu&temperature=nan",
+    "/hz?luminosity=-1",
+    "/hz?luminosity=0",
+    "/hz?luminosity=inf",
+    "/hz?luminosity=1&model=other",
+])
+def test_hz_rejects_inputs_without_bounds(service, target):
+    assert status_of(service, target) == 400
+
+
+@pytest.mark.parametrize("body, query", [
+    ({"luminosity": 1, "exoplanets": [1.0]}, "?model=kopparapu"),
+    ({"luminosity": -1, "exoplanets": [1.0]}, ""),
+    ({"luminosity": 1, "exoplanets": [1.0, -2.0]}, ""),
+    ({"luminosity": 1, "exoplanets": [1.0, None]}, ""),
+    ({"luminosity": 1, "exoplanets": [1.0], "planet_labels": ["a", "b"]}, ""),
+])
+def test_plot_rejects_invalid_systems_before_rendering(service, body, query):
+    assert status_of(service, "/plot.png" + query, "POST", body) == 400
+    assert service.stats["renders"] == 0 and not service._in_flight
+
+
+def test_classification_and_lookup(service):
+    status, result = get(service, "/systems/Sun/classification")
+    assert status == 200
+    zones = {planet["label"]: planet["zone"] for planet in result["planets"]}
+    assert zones["3.Earth"] == "Inside HZ" and zones["2.Venus"] == "Inner"
+    assert status_of(service, "/systems/Nowhere") == 404
@@ -0,0 +1,40 @@
+import numpy as np
+import pytest
+
+from measurements import (EXACT, JUPITER_MASS_IN_EARTH, LOWER_BOUND, RANGE, UPPER_BOUND, parse_column,
+                          parse_quantity)
+
+INF = np.inf
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("4,332.82", (4332.82, 4332.82, 4332.82, np.nan, EXACT)),
+    ("≥8.23M🜨", (8.23, 8.23, INF, np.nan, LOWER_BOUND)),
+    ("<0.1", (0.1, -INF, 0.1, np.nan, UPPER_BOUND)),
+    ("≤0.16", (0.16, -INF, 0.16, np.nan, UPPER_BOUND)),
+    ("0.038 ± 0.020", (0.038, 0.018, 0.058, 0.020, EXACT)),
+    ("14.39 Mass of Jupiter", (14.39 * JUPITER_MASS_IN_EARTH,) * 3 + (np.nan, EXACT)),
+    ("1—100 M🜨", (50.5, 1, 100, np.nan, RANGE)),
+    ("365.25 days", (365.25, 365.25, 365.25, np.nan, EXACT)),
+])
+def test_parse_quantity(text, expected):
+    value, low, high, error, bound, missing = parse_quantity(text)
+    assert not missing
+    assert bound == expected[4]
+    np.testing.assert_allclose([value, low, high, error], expected[:4], equal_nan=True)
+
+
+@pytest.mark.parametrize("text", ["-", "Unsure", "", "12 furlongs"])
+def test_placeholders_and_unknown_units_are_missing(text):
+    value, low, high, error, bound, missing = parse_quantity(text)
+    assert missing
+    assert np.isnan(value)
+
+
+def test_parse_column_matches_parse_quantity():
+    texts = ["4,332.82", "-", "<0.1", "-", "1—100 M🜨", "4,332.82"]
+    column = parse_column(texts)
+    expected = [parse_quantity(text) for text in texts]
+    np.testing.assert_array_equal(column.value, [row[0] for row in expected])
+    np.testing.assert_array_equal(column.bound, [row[4] for row in expected])
+    np.testing.assert_array_equal(column.missing, [False, True, False, True, False, False])
@@ -0,0 +1,55 @@
+import re
+
+import numpy as np
+import pytest
+
+from name_search import NameSearchIndex
+
+NAMES = ["Kepler-442", "HD 40307", "Kepler-4", "TRAPPIST-1", "Kepler-42", "GJ 667 C", "hd  4030", "K2-18",
+         "Kepler-186"]
+
+
+def found(index, query, limit=200):
+    return [NAMES[i] for i in index.search(query, limit)]
+
+
+@pytest.fixture
+def index():
+    return NameSearchIndex(NAMES)
+
+
+def test_prefix_matches_come_first_in_alphabetical_order(index):
+    assert found(index, "kepler-4") == ["Kepler-4", "Kepler-42", "Kepler-442"]
+    # Case and repeated spaces are ignored
+    assert found(index, "HD 4030") == ["hd  4030", "HD 40307"]
+
+
+def test_substring_matches_follow_prefix_matches_in_catalog_order(index):
+    assert found(index, "42") == ["Kepler-442", "Kepler-42"]
+    assert found(index, "-1") == ["TRAPPIST-1", "K2-18", "Kepler-186"]
+    assert found(index, "4") == ["Kepler-442", "HD 40307", "Kepler-4", "Kepler-42", "hd  4030"]
+    assert found(index, "nope") == []
+
+
+def test_wildcards(index):
+    assert found(index, "Kepler-4*") == ["Kepler-4", "Kepler-42", "Kepler-442"]
+    assert found(index, "*2") == ["Kepler-442", "Kepler-42"]
+    assert found(index, "k*1*") == ["K2-18", "Kepler-186"]
+    assert found(index, "*40*7") == ["HD 40307"]
+    assert found(index, "*") == NAMES
+
+
+def test_limit_and_empty_query(index):
+    assert found(index, "kepler", limit=2) == ["Kepler-186", "Kepler-4"]
+    assert found(index, "", limit=3) == NAMES[:3]
+
+
+def test_matches_a_linear_scan():
+    rng = np.random.default_rng(0)
+    names = ["".join(rng.choice(list("ab- 1"), rng.integers(1, 8))) for _ in range(500)]
+    index = NameSearchIndex(names)
+    for query in ["a", "ab", "b-1", "1 a", "a*b", "*-", "b*1*a"]:
+        regex = re.compile(".*".join(map(re.escape, query.split("*"))) + r"\Z")
+        expected = {i for i, name in enumerate(index.names)
+                    if (regex.match(name) if "*" in query else query in name)}
+        assert set(index.search(query, len(names)).tolist()) == expected
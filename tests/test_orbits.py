@@ -0,0 +1,67 @@
+import numpy as np
+import pytest
+
+from orbits import orbital_positions, solve_kepler, time_in_hz_fraction
+
+SAMPLES = 20_000
+
+
+def sampled_fraction(a, e, period, inner, outer):
+    # Share of evenly spaced times over one period at which each planet's
+    # distance from the star is within [inner, outer]
+    times = np.linspace(0, period, SAMPLES, endpoint=False)
+    positions = orbital_positions(a, e, np.full(len(a), period), times, dtype=np.float64)
+    radius = np.hypot(positions[..., 0], positions[..., 1])
+    return ((radius >= inner) & (radius <= outer)).mean(axis=0)
+
+
+def test_time_in_hz_fraction_matches_sampled_orbits():
+    a = np.array([1.0, 1.0, 1.0, 0.5, 2.0, 1.2, 0.9])
+    e = np.array([0.0, 0.3, 0.6, 0.0, 0.0, 0.9, 0.2])
+    inner, outer = 0.95, 1.37
+    expected = sampled_fraction(a, e, 365.25, inner, outer)
+    fraction = time_in_hz_fraction(a, e, inner, outer)
+    np.testing.assert_allclose(fraction, expected, atol=5 / SAMPLES)
+    assert fraction[0] == 1 and fraction[3] == 0 and fraction[4] == 0
+
+
+def test_time_in_hz_fraction_missing_values():
+    fraction = time_in_hz_fraction([1.0, np.nan, 1.0], [np.nan, 0.1, 0.0], [0.95, 0.95, np.nan], 1.37)
+    assert fraction[0] == 1  # missing eccentricity is treated as circular
+    assert np.isnan(fraction[1]) and np.isnan(fraction[2])
+
+
+def test_time_in_hz_fraction_chunking():
+    rng = np.random.default_rng(0)
+    a, e = rng.uniform(0.1, 3, 1000), rng.uniform(0, 0.95, 1000)
+    np.testing.assert_array_equal(time_in_hz_fraction(a, e, 0.95, 1.37, chunk_size=7),
+                                  time_in_hz_fraction(a, e, 0.95, 1.37))
+
+
+@pytest.mark.parametrize("eccentricity", [0.0, 0.5, 0.99, 1 - 1e-9])
+def test_solve_kepler(eccentricity):
+    mean_anomaly = np.linspace(0, 2 * np.pi, 1001)
+    anomaly, converged = solve_kepler(mean_anomaly, eccentricity)
+    residual = anomaly - eccentricity * np.sin(anomaly) - np.remainder(mean_anomaly, 2 * np.pi)
+    assert np.abs(residual).max() < 1e-9
+    assert converged.all()
+
+
+def test_solve_kepler_reports_unconverged_elements():
+    mean_anomaly = np.array([[0.5, 0.01], [np.nan, 1.0]])
+    eccentricity = np.array([[0.0, 0.99], [0.0, 0.0]])
+    anomaly, converged = solve_kepler(mean_anomaly, eccentricity, max_iterations=2)
+    np.testing.assert_array_equal(converged, [[True, False], [False, True]])
+    assert np.isfinite(anomaly[0, 1])  # the last iterate, not a placeholder
+    assert np.isnan(anomaly[1, 0])
+    with pytest.raises(ArithmeticError, match="2 orbits"):
+        solve_kepler(mean_anomaly, eccentricity, max_iterations=2, strict=True)
+
+
+def test_orbital_positions_convergence_mask():
+    times = np.linspace(0, 365.25, 50)
+    converged = np.zeros((len(times), 3), dtype=bool)
+    positions = orbital_positions([1.0, 2.0, np.nan], [0.1, 0.9, 0.0], [365.25, 1000.0, np.nan], times,
+                                  chunk_size=20, converged=converged)
+    assert converged[:, :2].all() and not converged[:, 2].any()
+    assert np.isfinite(positions[:, :2]).all()
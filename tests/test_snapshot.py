@@ -0,0 +1,69 @@
+import os
+
+import numpy as np
+import pytest
+
+import snapshot
+from catalog_loader import load_csv
+from snapshot import load_or_build, load_snapshot, save_snapshot, source_fingerprint
+
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path / "archive.csv"
+    path.write_text("hostname,pl_name,pl_orbsmax,st_rad,st_teff,st_lum,sy_dist\n"
+                    "X,X b,0.1,1,5000,,10\nX,X c,0.2,1,5000,,10\nY,Y b,1.0,,,0.5,\n")
+    return path
+
+
+def snapshots(directory):
+    return sorted(os.listdir(directory))
+
+
+def test_round_trip(source, tmp_path):
+    catalog = load_csv(source)
+    loaded = load_snapshot(save_snapshot(catalog, tmp_path / "snap", {"name": "x"}))
+    assert list(loaded.names) == list(catalog.names)
+    np.testing.assert_array_equal(loaded.offsets, catalog.offsets)
+    np.testing.assert_array_equal(loaded.luminosity, catalog.luminosity)
+
+
+def test_published_snapshot_survives_a_concurrent_rebuild(source, tmp_path, monkeypatch):
+    directory = tmp_path / "snap"
+    fingerprint = source_fingerprint(source)
+    published = save_snapshot(load_csv(source), directory, fingerprint)
+
+    # A second writer, paused after its first column, must not disturb
+    # readers of the published snapshot
+    real_save = np.save
+    loaded = []
+
+    def save_then_read(file, array):
+        real_save(file, array)
+        if not loaded:
+            loaded.append(load_or_build(source, lambda: pytest.fail("rebuilt"), directory))
+
+    monkeypatch.setattr(np, "save", save_then_read)
+    assert save_snapshot(load_csv(source), directory, fingerprint) == published
+    assert list(loaded[0].names) == ["X", "Y"]
+    assert snapshots(directory) == [os.path.basename(published)]
+
+
+def test_source_change_publishes_a_new_snapshot(source, tmp_path):
+    directory = tmp_path / "snap"
+    old = load_or_build(source, lambda: load_csv(source), directory)
+    source.write_text(source.read_text() + "Z,Z b,2.0,,,0.1,\n")
+    new = load_or_build(source, lambda: load_csv(source), directory)
+    assert list(new.names) == ["X", "Y", "Z"]
+    assert list(old.names) == ["X", "Y"]  # mapped pages outlive the removed files
+    assert snapshots(directory) == [os.path.basename(snapshot.snapshot_path(directory,
+                                                                            source_fingerprint(source)))]
+
+
+def test_built_catalog_is_returned_when_mapping_fails(source, tmp_path, monkeypatch):
+    def unavailable(directory):
+        raise FileNotFoundError(directory)
+
+    monkeypatch.setattr(snapshot, "load_snapshot", unavailable)
+    catalog = load_csv(source)
+    assert load_or_build(source, lambda: catalog, tmp_path / "snap") is catalog
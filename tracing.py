@@ -0,0 +1,124 @@
+import atexit
+import functools
+import json
+import os
+import threading
+import time
+from contextlib import nullcontext
+
+# Setting this to a file path enables tracing at import and writes the trace
+# there at exit.  "{pid}" in the path is replaced by the process id.
+TRACE_ENV = "HZ_TRACE"
+
+_enabled = False
+_events = []
+_threads = {}
+_origin = time.perf_counter_ns()
+_export_path = None
+# Returned by span() while tracing is off, so a disabled span costs one
+# global lookup and an empty `with`
+_NULL_SPAN = nullcontext()
+
+
+class _Span:
+    __slots__ = ("name", "args", "start")
+
+    def __init__(self, name, args):
+        self.name = name
+        self.args = args
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc_info):
+        end = time.perf_counter_ns()
+        thread = threading.get_ident()
+        if thread not in _threads:
+            _threads[thread] = threading.current_thread().name
+        # list.append is atomic, so spans from worker threads need no lock
+        _events.append((self.name, self.start, end, thread, self.args))
+        return False
+
+
+def span(name, **args):
+    # Context manager timing the enclosed block as a trace event named `name`;
+    # keyword arguments are stored with it.
+    if not _enabled:
+        return _NULL_SPAN
+    return _Span(name, args)
+
+
+def traced(name=None):
+    # Decorator form of span(); the span is named after the function by default
+    def decorate(function):
+        label = name or function.__qualname__
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return function(*args, **kwargs)
+            with _Span(label, {}):
+                return function(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def enable(path=None):
+    # Starts recording.  With `path`, the trace is also exported there at exit.
+    global _enabled, _export_path
+    _enabled = True
+    if path is not None:
+        if _export_path is None:
+            atexit.register(_export_at_exit)
+        _export_path = path
+
+
+def disable():
+    global _enabled
+    _enabled = False
+
+
+def is_enabled():
+    return _enabled
+
+
+def clear():
+    del _events[:]
+
+
+def trace_events():
+    # Recorded spans as Chrome trace "complete" events, plus thread names
+    pid = os.getpid()
+    events = [{"name": "thread_name", "ph": "M", "pid": pid, "tid": thread, "args": {"name": name}}
+              for thread, name in list(_threads.items())]
+    for name, start, end, thread, args in list(_events):
+        events.append({"name": name, "ph": "X", "ts": (start - _origin) / 1000, "dur": (end - start) / 1000,
+                       "pid": pid, "tid": thread, "args": args})
+    return events
+
+
+def export(path):
+    # Writes the trace in Chrome's trace event format (chrome://tracing, Perfetto)
+    from render_cache import atomic_write
+
+    trace = {"traceEvents": trace_events(), "displayTimeUnit": "ms"}
+    atomic_write(path.replace("{pid}", str(os.getpid())), json.dumps(trace, default=str).encode())
+
+
+def summary():
+    # {span name: (count, total ms)}, slowest first
+    totals = {}
+    for name, start, end, _, _ in list(_events):
+        count, total = totals.get(name, (0, 0.0))
+        totals[name] = (count + 1, total + (end - start) / 1e6)
+    return dict(sorted(totals.items(), key=lambda item: -item[1][1]))
+
+
+def _export_at_exit():
+    if _export_path is not None and _events:
+        export(_export_path)
+
+
+if os.environ.get(TRACE_ENV):
+    enable(os.environ[TRACE_ENV])
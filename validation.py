@@ -0,0 +1,47 @@
+from collections import namedtuple
+
+from catalog import PLANET_TEXT_COLUMNS, STAR_COLUMNS
+
+Issue = namedtuple("Issue", ["system", "kind", "detail"])
+
+# Issue kinds
+LENGTH_MISMATCH = "length mismatch"
+MERGED_DUPLICATE = "merged duplicate"
+CONFLICTING_DUPLICATE = "conflicting duplicate"
+
+
+def validate_systems(systems):
+    # One pass over raw system records before they become a Catalog.  Checks
+    # every planet list against the number of planets and folds records that
+    # share a name into the first one: a duplicate describing the same star
+    # and orbits is merged, one that contradicts it is dropped.  Returns the
+    # records with unique names, in first-seen order, and the issues found.
+    records = {}
+    issues = []
+    for system in systems:
+        name = system["name"]
+        count = len(system["exoplanets"])
+        for column in PLANET_TEXT_COLUMNS:
+            length = len(system.get(column, ()))
+            if length != count:
+                issues.append(Issue(name, LENGTH_MISMATCH, f"{length} {column} values for {count} planets"))
+
+        first = records.get(name)
+        if first is None:
+            records[name] = system
+            continue
+        differences = [f"{column} {system[column]!r} vs {first[column]!r}"
+                       for column in (*STAR_COLUMNS, "exoplanets") if system[column] != first[column]]
+        if differences:
+            issues.append(Issue(name, CONFLICTING_DUPLICATE,
+                                "dropped a later record with " + ", ".join(differences)))
+            continue
+        differing = [column for column in PLANET_TEXT_COLUMNS
+                     if list(system.get(column, ())) != list(first.get(column, ()))]
+        issues.append(Issue(name, MERGED_DUPLICATE, "identical record dropped" if not differing else
+                            "kept the first record's " + ", ".join(differing)))
+    return list(records.values()), issues
+
+
+def format_issues(issues):
+    return "\n".join(f"{issue.system}: {issue.kind}: {issue.detail}" for issue in issues)